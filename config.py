@@ -61,6 +61,11 @@ class Config:
     # Pixiv图片代理
     PIXIV_PROXY_URL = os.getenv('PIXIV_PROXY_URL', 'https://i.pixiv.re')
 
+    # 作品元数据更新时并行请求详情的数量（共用同一速率限制器）
+    PIXIV_UPDATE_CONCURRENCY = int(
+        os.getenv('PIXIV_UPDATE_CONCURRENCY', 4)
+    )
+
     # GitHub仓库URL
     GITHUB_URL = GITHUB_URL
 
@@ -106,6 +111,15 @@ class Config:
     SQLALCHEMY_ENGINE_OPTIONS = {
         'pool_pre_ping': True,
         'pool_recycle': 3600,
+        # 连接池大小，默认约为CPU数的2倍（不少于SQLAlchemy默认的5）
+        # 变量留空时同样使用默认值
+        'pool_size': int(
+            os.getenv('MYSQL_POOL_SIZE')
+            or max(5, (os.cpu_count() or 1) * 2)
+        ),
+        'max_overflow': int(
+            os.getenv('MYSQL_MAX_OVERFLOW') or 10
+        ),
     }
 
     SQLALCHEMY_DATABASE_URI = (
@@ -4,7 +4,6 @@ import logging
 from flask import Blueprint, jsonify, request
 from flask_login import login_required
 
-from repositories.collection_repository import CollectionRepository
 from services import huey_service, services
 
 logger = logging.getLogger(__name__)
@@ -130,8 +129,7 @@ def get_collect_status():
     follow_stats = services.follow.get_stats()
 
     # 获取最新日志
-    log_repo = CollectionRepository()
-    recent_logs = log_repo.get_recent(10)
+    recent_logs = services.collection.get_recent_logs(10)
 
     return jsonify({
         'success': True,
@@ -155,8 +153,7 @@ def get_collect_logs():
     # 参数验证
     per_page = min(max(per_page, 1), 100)
 
-    log_repo = CollectionRepository()
-    pagination = log_repo.get_logs_page(
+    pagination = services.collection.get_logs_page(
         page=page,
         per_page=per_page,
         log_type_filter=type_filter if type_filter else None,
@@ -91,7 +91,7 @@ def update_config():
 
     # 检查是否更新了速率限制配置，如果是则重置 Pixiv service
     rate_limit_keys = [
-        'api_delay_min', 'api_delay_max',
+        'api_delay_min', 'api_delay_max', 'api_burst',
         'error_delay_429_min', 'error_delay_429_max',
         'error_delay_403_min', 'error_delay_403_max',
         'error_delay_other_min', 'error_delay_other_max'
@@ -44,15 +44,14 @@ def get_public_stats():
 
     # 图表数据 - 最近7天采集趋势
     daily_trend = []
+    artworks = services.artwork.search_artworks_raw(
+        page=1, per_page=1000
+    )
     for i in range(7):
         date = (datetime.now() - timedelta(days=6-i)).date()
         start_of_day = datetime.combine(date, datetime.min.time())
         end_of_day = datetime.combine(date, datetime.max.time())
 
-        artworks = services.artwork.search_artworks_raw(
-            page=1, per_page=1000
-        )
-
         count = 0
         for artwork in artworks:
             if start_of_day <= artwork.created_at <= end_of_day:
@@ -101,12 +100,16 @@ def get_random_artwork():
 
     tags_filter = tags_param if tags_param else None
 
-    # 使用Service获取随机作品
+    # 获取代理URL配置
+    proxy_url = current_app.config.get('PIXIV_PROXY_URL', 'https://i.pixiv.re')
+
+    # 使用Service获取随机作品（同时替换URL为代理URL）
     artworks_data = services.artwork.get_random_artworks(
         limit=limit,
         is_r18=is_r18_filter,
         tags_filter=tags_filter,
-        tags_match=tags_match
+        tags_match=tags_match,
+        proxy_url=proxy_url
     )
 
     if not artworks_data:
@@ -115,15 +118,6 @@ def get_random_artwork():
             'message': '未找到符合条件的作品'
         })
 
-    # 获取代理URL配置
-    proxy_url = current_app.config.get('PIXIV_PROXY_URL', 'https://i.pixiv.re')
-
-    # 替换URL为代理URL
-    for artwork in artworks_data:
-        artwork['url'] = artwork['url'].replace(
-            'https://i.pximg.net', proxy_url
-        )
-
     return jsonify({
         'success': True,
         'count': len(artworks_data),
@@ -50,6 +50,12 @@ def get_engine() -> Engine:
             pool_recycle=Config.SQLALCHEMY_ENGINE_OPTIONS.get(
                 'pool_recycle', 3600
             ),
+            pool_size=Config.SQLALCHEMY_ENGINE_OPTIONS.get(
+                'pool_size', 5
+            ),
+            max_overflow=Config.SQLALCHEMY_ENGINE_OPTIONS.get(
+                'max_overflow', 10
+            ),
             echo=Config.DEBUG
         )
 
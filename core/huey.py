@@ -1,5 +1,6 @@
 """Huey任务队列初始化."""
 from huey import RedisExpireHuey
+from huey.api import Result, Task
 
 from config import Config
 
@@ -11,6 +12,31 @@ huey = RedisExpireHuey(
     db=int(Config.HUEY_REDIS_DB),
     password=Config.HUEY_REDIS_PASSWORD,
     always_eager=False,  # 生产环境设置为False，开发环境可以设为True同步执行
-    results=True,  # 存储任务结果
+    results=True,  # 存储任务结果（前端轮询任务状态需要）
     store_none=False,  # 不存储None值
+    # 结果按TTL过期，定时分发的任务结果无人读取也不会堆积
+    expire_time=Config.HUEY_RESULT_TIMEOUT,
 )
+
+
+def enqueue_many(tasks: list[Task]) -> list[Result]:
+    """
+    批量入队任务（一次Redis往返）.
+
+    Args:
+        tasks: 任务列表（通过task_func.s(...)创建）
+
+    Returns:
+        任务结果句柄列表
+    """
+    if huey.immediate:
+        return [huey.enqueue(task) for task in tasks]
+
+    storage = huey.storage
+    with storage.conn.pipeline(transaction=False) as pipe:
+        for task in tasks:
+            if task.expires:
+                task.resolve_expires(huey.utc)
+            pipe.lpush(storage.queue_key, huey.serialize_task(task))
+        pipe.execute()
+    return [Result(huey, task) for task in tasks]
@@ -2,9 +2,9 @@
 """数据库迁移脚本."""
 from typing import TypedDict
 
-from sqlalchemy import select
+from sqlalchemy import inspect, select
 
-from core.database import create_all_tables, session_scope
+from core.database import Base, create_all_tables, get_engine, session_scope
 from models import SchedulerConfig, SystemConfig, User
 
 
@@ -14,6 +14,26 @@ class ConfigValue(TypedDict):
     desc: str
 
 
+def ensure_indexes():
+    """为已存在的表补建模型中新增的索引"""
+    engine = get_engine()
+    inspector = inspect(engine)
+
+    created_count = 0
+    for table in Base.metadata.sorted_tables:
+        existing = {
+            index['name'] for index in inspector.get_indexes(table.name)
+        }
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            index.create(bind=engine)
+            created_count += 1
+            print(f'  Created index: {table.name}.{index.name}')
+
+    print(f'Migration completed: {created_count} index created.')
+
+
 def insert_default_scheduler_config():
     """插入默认SchedulerConfig"""
     config_mapping: dict[str, str] = {
@@ -122,6 +142,11 @@ def insert_default_system_config():
             'type': 'float',
             'desc': 'API请求最大延迟（秒）'
         },
+        'api_burst': {
+            'value': '1',
+            'type': 'integer',
+            'desc': '空闲后允许连续发送的请求数'
+        },
         'error_delay_429_min': {
             'value': '30',
             'type': 'float',
@@ -200,6 +225,9 @@ if __name__ == '__main__':
     print('Creating database tables...')
     create_all_tables()
 
+    # 补建索引
+    ensure_indexes()
+
     # SchedulerConfig默认值
     insert_default_scheduler_config()
 
@@ -1,13 +1,50 @@
 """作品模型."""
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import JSON, Boolean, DateTime, Index, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Dialect,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 
 from core.database import BaseModel
 from utils.time_utils import format_datetime, get_utc_now
 
 
+class TagList(TypeDecorator):
+    """标签列表类型（JSON存储，读写时统一为list）."""
+
+    impl = JSON
+    cache_ok = True
+
+    @staticmethod
+    def _to_list(value: Any) -> list:
+        """统一转换为list."""
+        if isinstance(value, list):
+            return value
+        # 向后兼容：非列表类型尝试转换
+        if isinstance(value, (tuple, set)):
+            return list(value)
+        return []
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> list:
+        """写入前转换."""
+        return self._to_list(value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> list:
+        """读取后转换."""
+        return self._to_list(value)
+
+
 class Artwork(BaseModel):
     """作品模型."""
 
@@ -16,6 +53,10 @@ class Artwork(BaseModel):
     # 索引
     __table_args__ = (
         Index('idx_post_date', 'post_date'),
+        # 有效/R18统计使用的覆盖索引（MySQL不支持部分索引）
+        Index('idx_valid_r18', 'is_valid', 'is_r18'),
+        # 标签多值索引（MySQL 8.0.17+），供标签精确过滤使用
+        Index('idx_tags', text('(CAST(tags AS CHAR(255) ARRAY))')),
     )
     illust_id: Mapped[int] = mapped_column(
         Integer, index=True, nullable=False
@@ -47,7 +88,9 @@ class Artwork(BaseModel):
     rank_date: Mapped[datetime | None] = mapped_column(
         DateTime, nullable=True
     )
-    tags: Mapped[list] = mapped_column(JSON, default=list, nullable=False)
+    tags: Mapped[list] = mapped_column(
+        TagList, default=list, nullable=False
+    )
     is_r18: Mapped[bool] = mapped_column(
         Boolean, default=False, nullable=False
     )
@@ -77,18 +120,6 @@ class Artwork(BaseModel):
 
     def to_dict(self) -> dict:
         """转换为字典."""
-        # tags字段已经是JSON类型，直接使用，确保类型安全
-        tags_list = []
-        if self.tags:
-            if isinstance(self.tags, list):
-                tags_list = self.tags
-            else:
-                # 向后兼容：如果不是列表类型，尝试转换
-                try:
-                    tags_list = list(self.tags)
-                except (TypeError, ValueError):
-                    tags_list = []
-
         return {
             'id': self.id,
             'illust_id': self.illust_id,
@@ -103,7 +134,7 @@ class Artwork(BaseModel):
             'total_view': self.total_view,
             'rank': self.rank,
             'rank_date': format_datetime(self.rank_date, '%Y-%m-%d'),
-            'tags': tags_list,
+            'tags': self.tags,
             'is_r18': self.is_r18,
             'type': self.type,
             'collect_type': self.collect_type,
@@ -52,9 +52,7 @@ class SystemConfig(BaseModel):
             )
         elif self.value_type == 'datetime':
             value = (
-                datetime.strptime(
-                    self.config_value, '%Y-%m-%d %H:%M:%S'
-                )
+                datetime.fromisoformat(self.config_value)
                 if self.config_value else None
             )
         else:
@@ -1,7 +1,8 @@
 """API密钥Repository."""
+from datetime import datetime
 from typing import ClassVar
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
 
 from models.api_key import ApiKey
 from repositories.base_repository import BaseRepository
@@ -61,21 +62,31 @@ class ApiKeyRepository(BaseRepository[ApiKey]):
             ).scalars().all()
             return api_keys
 
-    def update_usage(self, key: str) -> None:
+    def add_usage(self, usage: dict[str, tuple[int, datetime]]) -> None:
         """
-        更新API密钥使用统计.
+        批量累加API密钥使用统计（一条executemany UPDATE）.
 
         Args:
-            key: API密钥字符串
+            usage: {key: (新增次数, 最后使用时间)}
         """
+        if not usage:
+            return
+
+        stmt = (
+            update(ApiKey)
+            .where(ApiKey.key == bindparam('b_key'))
+            .values(
+                usage_count=ApiKey.usage_count + bindparam('b_count'),
+                last_used_at=bindparam('b_used_at')
+            )
+        )
+        rows = [
+            {'b_key': key, 'b_count': count, 'b_used_at': used_at}
+            for key, (count, used_at) in usage.items()
+        ]
+        # 经Connection执行为Core executemany，绕开ORM按主键批量更新
         with self.get_session() as session:
-            api_key: ApiKey | None = session.execute(
-                select(ApiKey).where(ApiKey.key == key)
-            ).scalar_one_or_none()
-
-            if api_key:
-                api_key.update_usage()
-                session.flush()
+            session.connection().execute(stmt, rows)
 
     def toggle_status(self, id: int) -> ApiKey | None:
         """
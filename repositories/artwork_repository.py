@@ -1,17 +1,86 @@
 """作品Repository（SQLAlchemy 2.0）."""
 import logging
 from datetime import UTC, datetime
-from typing import Any, ClassVar
-
-from sqlalchemy import delete, func, or_, select
+from typing import Any, ClassVar, TypedDict
+
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session
 
 from models.artwork import Artwork
-from repositories.base_repository import BaseRepository
+from repositories.base_repository import BATCH_CHUNK_SIZE, BaseRepository
 from utils.pagination import Pagination
 
 logger = logging.getLogger(__name__)
 
 
+class ArtworkRow(TypedDict):
+    """待插入的作品数据（一页一行，id由数据库分配）."""
+
+    illust_id: int
+    title: str
+    author_id: int
+    author_name: str
+    url: str
+    share_url: str
+    page_index: int
+    page_count: int
+    total_bookmarks: int
+    total_view: int
+    rank: int | None
+    rank_date: datetime | None
+    post_date: datetime | None
+    tags: list[str]
+    is_r18: bool
+    type: str
+    is_valid: bool
+    error_message: str | None
+    last_updated_at: datetime | None
+    collect_type: str
+    created_at: datetime
+
+
+def _build_tags_condition(
+    tags_filter: str | None, tags_match: str = 'or'
+) -> ColumnElement | None:
+    """
+    构建标签过滤条件.
+
+    使用JSON_OVERLAPS/JSON_CONTAINS精确匹配标签，
+    可命中tags上的多值索引（idx_tags），避免全表扫描.
+
+    Args:
+        tags_filter: 标签过滤（逗号分隔）
+        tags_match: 标签匹配方式（or/and）
+
+    Returns:
+        过滤条件，无有效标签时返回None
+    """
+    if not tags_filter:
+        return None
+
+    tags_list = list(dict.fromkeys(
+        tag.strip() for tag in tags_filter.split(',') if tag.strip()
+    ))
+    if not tags_list:
+        return None
+
+    candidates = func.json_array(*tags_list)
+    if tags_match.lower() == 'and':
+        # AND模式：所有标签都必须包含
+        return func.json_contains(Artwork.tags, candidates)
+    # OR模式：任一标签命中即可
+    return func.json_overlaps(Artwork.tags, candidates)
+
+
 class ArtworkRepository(BaseRepository[Artwork]):
     """作品数据访问层."""
 
@@ -59,6 +128,31 @@ class ArtworkRepository(BaseRepository[Artwork]):
             ).scalar_one_or_none()
             return artwork
 
+    def get_map_by_illust_ids(
+        self, illust_ids: list[int], page_index: int = 0
+    ) -> dict[int, Artwork]:
+        """
+        批量获取指定页的作品.
+
+        Args:
+            illust_ids: 作品ID列表
+            page_index: 页面索引
+
+        Returns:
+            作品ID到作品实例的映射
+        """
+        if not illust_ids:
+            return {}
+
+        with self.get_session() as session:
+            result = session.execute(
+                select(Artwork).where(
+                    Artwork.illust_id.in_(illust_ids),
+                    Artwork.page_index == page_index
+                )
+            ).scalars().all()
+            return {artwork.illust_id: artwork for artwork in result}
+
     def get_by_illust_id(self, illust_id: int) -> list[Artwork]:
         """
         根据illust_id获取所有页.
@@ -137,8 +231,8 @@ class ArtworkRepository(BaseRepository[Artwork]):
         """统计有效作品数量."""
         with self.get_session() as session:
             result = session.execute(
-                select(func.count()).select_from(
-                    select(Artwork).where(Artwork.is_valid).subquery()
+                select(func.count()).select_from(Artwork).where(
+                    Artwork.is_valid
                 )
             ).scalar()
             return result or 0
@@ -147,18 +241,14 @@ class ArtworkRepository(BaseRepository[Artwork]):
         """统计R18作品数量."""
         with self.get_session() as session:
             result = session.execute(
-                select(func.count()).select_from(
-                    select(Artwork).where(
-                        Artwork.is_r18, Artwork.is_valid
-                    ).subquery()
+                select(func.count()).select_from(Artwork).where(
+                    Artwork.is_valid, Artwork.is_r18
                 )
             ).scalar()
             return result or 0
 
-    def search_artworks(
+    def _build_search_query(
         self,
-        page: int = 1,
-        per_page: int = 20,
         type_filter: str | None = None,
         collect_type_filter: str | None = None,
         is_r18_filter: bool | None = None,
@@ -169,13 +259,11 @@ class ArtworkRepository(BaseRepository[Artwork]):
         tags_filter: str | None = None,
         tags_match: str = 'or',
         illust_id_filter: int | None = None
-    ) -> Pagination:
+    ) -> Select:
         """
-        搜索作品（支持多条件过滤）.
+        构建作品搜索查询（不含排序与分页）.
 
         Args:
-            page: 页码
-            per_page: 每页数量
             type_filter: 类型过滤
             collect_type_filter: 采集类型过滤
             is_r18_filter: R18过滤
@@ -188,72 +276,71 @@ class ArtworkRepository(BaseRepository[Artwork]):
             illust_id_filter: 作品ID过滤
 
         Returns:
-            分页结果
+            查询语句
         """
-        with self.get_session() as session:
-            query = select(Artwork)
+        query = select(Artwork)
 
-            # 类型过滤
-            if type_filter:
-                query = query.filter(Artwork.type == type_filter)
+        # 类型过滤
+        if type_filter:
+            query = query.filter(Artwork.type == type_filter)
 
-            # 采集类型过滤
-            if collect_type_filter:
-                query = query.filter(
-                    Artwork.collect_type == collect_type_filter
-                )
+        # 采集类型过滤
+        if collect_type_filter:
+            query = query.filter(
+                Artwork.collect_type == collect_type_filter
+            )
 
-            # R18过滤
-            if is_r18_filter is not None:
-                query = query.filter(Artwork.is_r18 == is_r18_filter)
+        # R18过滤
+        if is_r18_filter is not None:
+            query = query.filter(Artwork.is_r18 == is_r18_filter)
 
-            # 作品ID筛选
-            if illust_id_filter:
-                query = query.filter(Artwork.illust_id == illust_id_filter)
+        # 作品ID筛选
+        if illust_id_filter:
+            query = query.filter(Artwork.illust_id == illust_id_filter)
 
-            # 作者名筛选
-            if author_name_filter:
-                query = query.filter(
-                    Artwork.author_name.like(f'%{author_name_filter}%')
-                )
+        # 作者名筛选
+        if author_name_filter:
+            query = query.filter(
+                Artwork.author_name.like(f'%{author_name_filter}%')
+            )
 
-            # 有效状态筛选
-            if is_valid_filter is not None:
-                query = query.filter(Artwork.is_valid == is_valid_filter)
+        # 有效状态筛选
+        if is_valid_filter is not None:
+            query = query.filter(Artwork.is_valid == is_valid_filter)
 
-            # 发布时间范围筛选
-            if post_date_start:
-                query = query.filter(Artwork.post_date >= post_date_start)
+        # 发布时间范围筛选
+        if post_date_start:
+            query = query.filter(Artwork.post_date >= post_date_start)
 
-            if post_date_end:
-                query = query.filter(Artwork.post_date <= post_date_end)
+        if post_date_end:
+            query = query.filter(Artwork.post_date <= post_date_end)
 
-            # 标签过滤
-            if tags_filter:
-                tags_list = [
-                    tag.strip()
-                    for tag in tags_filter.split(',') if tag.strip()
-                ]
-                if tags_list:
-                    # 使用MySQL的JSON_SEARCH函数查找包含指定标签
-                    if tags_match.lower() == 'and':
-                        # AND模式：所有标签都必须匹配
-                        for tag in tags_list:
-                            query = query.filter(
-                                func.json_search(
-                                    Artwork.tags, 'one', f'%{tag}%'
-                                ).is_not(None)
-                            )
-                    else:
-                        # OR模式：任一标签匹配即可
-                        or_conditions = [
-                            func.json_search(
-                                Artwork.tags, 'one', f'%{tag}%'
-                            ).is_not(None)
-                            for tag in tags_list
-                        ]
-                        query = query.filter(or_(*or_conditions))
+        # 标签过滤
+        tags_condition = _build_tags_condition(tags_filter, tags_match)
+        if tags_condition is not None:
+            query = query.filter(tags_condition)
 
+        return query
+
+    def search_artworks(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        **filters: Any
+    ) -> Pagination:
+        """
+        搜索作品（支持多条件过滤）.
+
+        Args:
+            page: 页码
+            per_page: 每页数量
+            **filters: 过滤条件，见_build_search_query
+
+        Returns:
+            分页结果
+        """
+        query = self._build_search_query(**filters)
+        with self.get_session() as session:
             # 先获取总数
             total_query = select(func.count()).select_from(query.subquery())
             total = session.execute(total_query).scalar() or 0
@@ -267,6 +354,34 @@ class ArtworkRepository(BaseRepository[Artwork]):
 
             return Pagination(list(items), total, page, per_page)
 
+    def list_artworks(
+        self,
+        limit: int | None = None,
+        offset: int = 0,
+        **filters: Any
+    ) -> list[Artwork]:
+        """
+        按条件获取作品列表（不分页，不统计总数）.
+
+        Args:
+            limit: 限制返回数量，None则不限制
+            offset: 偏移量
+            **filters: 过滤条件，见_build_search_query
+
+        Returns:
+            作品实例列表
+        """
+        query = self._build_search_query(**filters).order_by(
+            Artwork.created_at.desc()
+        )
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+
+        with self.get_session() as session:
+            return list(session.execute(query).scalars().all())
+
     def get_random_artworks(
         self,
         limit: int = 10,
@@ -296,30 +411,9 @@ class ArtworkRepository(BaseRepository[Artwork]):
                 query = query.where(Artwork.is_r18 == is_r18)
 
             # 标签过滤
-            if tags_filter:
-                tags_list = [
-                    tag.strip()
-                    for tag in tags_filter.split(',') if tag.strip()
-                ]
-                if tags_list:
-                    # 使用MySQL的JSON_SEARCH函数查找包含指定标签
-                    if tags_match.lower() == 'and':
-                        # AND模式：所有标签都必须匹配
-                        for tag in tags_list:
-                            query = query.filter(
-                                func.json_search(
-                                    Artwork.tags, 'one', f'%{tag}%'
-                                ).is_not(None)
-                            )
-                    else:
-                        # OR模式：任一标签匹配即可
-                        or_conditions = [
-                            func.json_search(
-                                Artwork.tags, 'one', f'%{tag}%'
-                            ).is_not(None)
-                            for tag in tags_list
-                        ]
-                        query = query.filter(or_(*or_conditions))
+            tags_condition = _build_tags_condition(tags_filter, tags_match)
+            if tags_condition is not None:
+                query = query.filter(tags_condition)
 
             query = query.order_by(func.random()).limit(limit)
             result = session.execute(query).scalars().all()
@@ -387,17 +481,82 @@ class ArtworkRepository(BaseRepository[Artwork]):
             更新的作品数量
         """
         with self.get_session() as session:
-            artworks = session.execute(
-                select(Artwork).where(Artwork.illust_id == illust_id)
-            ).scalars().all()
+            result = session.execute(
+                update(Artwork).where(
+                    Artwork.illust_id == illust_id
+                ).values(
+                    is_valid=False,
+                    error_message=reason
+                )
+            )
+            return int(result.rowcount)
 
-            count = 0
-            for artwork in artworks:
-                artwork.is_valid = False
-                artwork.error_message = reason
-                count += 1
+    def batch_update_stats(self, updates: list[dict]) -> int:
+        """
+        批量更新作品的书签数和浏览数（一个事务内按主键executemany）.
 
-            return count
+        Args:
+            updates: 更新数据列表，每项需包含id及要更新的字段
+
+        Returns:
+            更新的作品数量
+        """
+        if not updates:
+            return 0
+
+        with self.get_session() as session:
+            for start in range(0, len(updates), BATCH_CHUNK_SIZE):
+                session.execute(
+                    update(Artwork),
+                    updates[start:start + BATCH_CHUNK_SIZE]
+                )
+            return len(updates)
+
+    def mark_illusts_invalid(
+        self, illust_ids: set[int], reason: str
+    ) -> int:
+        """
+        批量标记多个作品的所有页为失效.
+
+        Args:
+            illust_ids: 作品ID集合
+            reason: 失效原因
+
+        Returns:
+            更新的作品数量
+        """
+        if not illust_ids:
+            return 0
+
+        with self.get_session() as session:
+            result = session.execute(
+                update(Artwork).where(
+                    Artwork.illust_id.in_(illust_ids)
+                ).values(
+                    is_valid=False,
+                    error_message=reason
+                )
+            )
+            return int(result.rowcount)
+
+    def delete_by_illust_ids(self, illust_ids: set[int]) -> int:
+        """
+        批量删除多个作品的所有页.
+
+        Args:
+            illust_ids: 作品ID集合
+
+        Returns:
+            删除的作品数量
+        """
+        if not illust_ids:
+            return 0
+
+        with self.get_session() as session:
+            result = session.execute(
+                delete(Artwork).where(Artwork.illust_id.in_(illust_ids))
+            )
+            return int(result.rowcount)
 
     def delete_by_illust_id(self, illust_id: int) -> int:
         """
@@ -443,10 +602,15 @@ class ArtworkRepository(BaseRepository[Artwork]):
             result = session.execute(query).scalars().all()
             return list(result)
 
-    def batch_create(self, artworks_data: list[dict]) -> int:
+    def batch_create(
+        self, artworks_data: list[ArtworkRow] | list[dict]
+    ) -> int:
         """
         批量创建作品.
 
+        按块预查已存在的(illust_id, page_index)，
+        其余数据以executemany方式一次性插入.
+
         Args:
             artworks_data: 作品数据列表
 
@@ -455,45 +619,96 @@ class ArtworkRepository(BaseRepository[Artwork]):
         """
         created_count = 0
         with self.get_session() as session:
-            for data in artworks_data:
-                illust_id = data['illust_id']
-                page_index = data.get('page_index', 0)
-
-                # 去重检查
-                existing = session.execute(
-                    select(Artwork).where(
-                        Artwork.illust_id == illust_id,
-                        Artwork.page_index == page_index
+            for start in range(0, len(artworks_data), BATCH_CHUNK_SIZE):
+                chunk = artworks_data[start:start + BATCH_CHUNK_SIZE]
+
+                # 去重检查（数据库中已存在 + 本批次内重复）
+                existing = self._get_existing_page_keys(
+                    session, {data['illust_id'] for data in chunk}
+                )
+                rows = []
+                for data in chunk:
+                    key = (data['illust_id'], data.get('page_index', 0))
+                    if key in existing:
+                        continue
+                    existing.add(key)
+                    # id由数据库自增分配，解析结果不含id时直接使用
+                    rows.append(
+                        data if 'id' not in data
+                        else {k: v for k, v in data.items() if k != 'id'}
                     )
-                ).scalar_one_or_none()
 
-                if not existing:
-                    artwork = Artwork(**data)
-                    session.add(artwork)
-                    created_count += 1
+                if rows:
+                    session.execute(insert(Artwork), rows)
+                    created_count += len(rows)
 
             return created_count
 
+    def get_existing_page_keys(
+        self, illust_ids: set[int]
+    ) -> set[tuple[int, int]]:
+        """
+        查询已入库的(illust_id, page_index)组合.
+
+        Args:
+            illust_ids: 作品ID集合
+
+        Returns:
+            (illust_id, page_index)集合
+        """
+        with self.get_session() as session:
+            return self._get_existing_page_keys(session, illust_ids)
+
+    @staticmethod
+    def _get_existing_page_keys(
+        session: Session, illust_ids: set[int]
+    ) -> set[tuple[int, int]]:
+        """
+        查询已存在的(illust_id, page_index)组合.
+
+        Args:
+            session: 数据库会话
+            illust_ids: 作品ID集合
+
+        Returns:
+            (illust_id, page_index)集合
+        """
+        if not illust_ids:
+            return set()
+        rows = session.execute(
+            select(Artwork.illust_id, Artwork.page_index).where(
+                Artwork.illust_id.in_(illust_ids)
+            )
+        ).all()
+        return {(illust_id, page_index) for illust_id, page_index in rows}
+
     def get_artworks_for_update(
         self,
         post_date_start: datetime,
         per_page: int = 200
-    ) -> list[Artwork]:
+    ) -> list[Row]:
         """
         获取需要更新的作品（有效，按last_updated_at升序）.
 
+        只查询更新所需的列，不构建ORM实例.
+
         Args:
             post_date_start: 发布开始日期
             per_page: 每次处理数量
 
         Returns:
-            作品实例列表
+            (id, illust_id, total_bookmarks, total_view)行列表
         """
         update_date = datetime.now().replace(
             hour=0, minute=0, second=0, microsecond=0
         ).astimezone(UTC)
         with self.get_session() as session:
-            query = select(Artwork).where(
+            query = select(
+                Artwork.id,
+                Artwork.illust_id,
+                Artwork.total_bookmarks,
+                Artwork.total_view
+            ).where(
                 Artwork.is_valid,
                 Artwork.post_date >= post_date_start,
                 Artwork.last_updated_at < update_date
@@ -501,7 +716,7 @@ class ArtworkRepository(BaseRepository[Artwork]):
                 Artwork.last_updated_at.asc()
             ).limit(per_page)
 
-            return list(session.execute(query).scalars().all())
+            return list(session.execute(query).all())
 
     def restore_page(
         self, artwork_id: int
@@ -534,17 +749,15 @@ class ArtworkRepository(BaseRepository[Artwork]):
             更新的作品数量
         """
         with self.get_session() as session:
-            artworks = session.execute(
-                select(Artwork).where(Artwork.illust_id == illust_id)
-            ).scalars().all()
-
-            count = 0
-            for artwork in artworks:
-                artwork.is_valid = True
-                artwork.error_message = None
-                count += 1
-
-            return count
+            result = session.execute(
+                update(Artwork).where(
+                    Artwork.illust_id == illust_id
+                ).values(
+                    is_valid=True,
+                    error_message=None
+                )
+            )
+            return int(result.rowcount)
 
     def delete_by_author_id(self, author_id: int) -> int:
         """
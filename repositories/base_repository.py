@@ -10,6 +10,9 @@ from core.session import session_scope
 
 T = TypeVar('T', bound=BaseModel)
 
+# 批量写入时每块的行数
+BATCH_CHUNK_SIZE = 500
+
 if TYPE_CHECKING:
     pass
 
@@ -65,6 +65,23 @@ class ConfigRepository(BaseRepository[SystemConfig]):
 
             return {item.config_key: item.config_value for item in configs}
 
+    def get_all_raw(self) -> list[tuple[str, str | None, str]]:
+        """
+        获取所有配置的键、字符串值和类型.
+
+        Returns:
+            (配置键, 配置值, 值类型)列表
+        """
+        with self.get_session() as session:
+            rows = session.execute(
+                select(
+                    SystemConfig.config_key,
+                    SystemConfig.config_value,
+                    SystemConfig.value_type
+                )
+            ).all()
+            return [tuple(row) for row in rows]
+
     def set_config(
         self,
         config_key: str,
@@ -96,14 +113,63 @@ class ConfigRepository(BaseRepository[SystemConfig]):
                 return config
             else:
                 # 创建新配置时同时设置 value_type
+                now = datetime.now()
                 new_config = SystemConfig(
                     id=0,  # 将由数据库自动分配
                     config_key=config_key,
                     config_value=value,
                     value_type=value_type,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now()
+                    created_at=now,
+                    updated_at=now
                 )
                 session.add(new_config)
                 session.flush()
                 return new_config
+
+    def batch_set_config(
+        self, items: list[tuple[str, str | None, str]]
+    ) -> int:
+        """
+        在同一事务中批量设置配置.
+
+        Args:
+            items: (配置键, 配置值字符串, 值类型)列表
+
+        Returns:
+            写入的配置数量
+        """
+        if not items:
+            return 0
+
+        with self.get_session() as session:
+            existing = {
+                config.config_key: config
+                for config in session.execute(
+                    select(SystemConfig).where(
+                        SystemConfig.config_key.in_(
+                            [key for key, _, _ in items]
+                        )
+                    )
+                ).scalars().all()
+            }
+
+            now = datetime.now()
+            for config_key, value, value_type in items:
+                config = existing.get(config_key)
+                if config:
+                    config.config_value = value
+                    config.value_type = value_type
+                else:
+                    # 创建新配置时同时设置 value_type
+                    config = SystemConfig(
+                        config_key=config_key,
+                        config_value=value,
+                        value_type=value_type,
+                        created_at=now,
+                        updated_at=now
+                    )
+                    session.add(config)
+                    existing[config_key] = config
+
+            session.flush()
+            return len(items)
@@ -2,11 +2,12 @@
 from datetime import datetime, timedelta
 from typing import Any, ClassVar
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, select, update
 
 from models.follow import Follow
-from repositories.base_repository import BaseRepository
+from repositories.base_repository import BATCH_CHUNK_SIZE, BaseRepository
 from utils.pagination import Pagination
+from utils.time_utils import format_datetime
 
 
 class FollowRepository(BaseRepository[Follow]):
@@ -123,6 +124,45 @@ class FollowRepository(BaseRepository[Follow]):
             result = session.execute(query).scalars().all()
             return list(result)
 
+    def get_active_users_dicts(self, limit: int = 10) -> list[dict]:
+        """
+        获取最活跃用户的展示字段（按last_artwork_date降序）.
+
+        只查询展示所需的列，不构造ORM实例.
+
+        Args:
+            limit: 限制返回数量
+
+        Returns:
+            用户字典列表
+        """
+        with self.get_session() as session:
+            query = select(
+                Follow.user_id,
+                Follow.user_name,
+                Follow.avatar_url,
+                Follow.last_artwork_date,
+                Follow.last_collect_date
+            ).filter(
+                Follow.last_artwork_date.is_not(None)
+            ).order_by(
+                Follow.last_artwork_date.desc()
+            ).limit(limit)
+
+            return [
+                {
+                    'user_id': user_id,
+                    'user_name': user_name,
+                    'avatar_url': avatar_url,
+                    'last_artwork_date': format_datetime(last_artwork_date),
+                    'last_collect_date': format_datetime(last_collect_date)
+                }
+                for (
+                    user_id, user_name, avatar_url,
+                    last_artwork_date, last_collect_date
+                ) in session.execute(query)
+            ]
+
     def get_by_all(self, limit: int | None = None) -> list[Follow]:
         """
         获取所有关注用户.
@@ -140,11 +180,61 @@ class FollowRepository(BaseRepository[Follow]):
             result = session.execute(query).scalars().all()
             return list(result)
 
+    def get_by_user_ids(self, user_ids: list[int]) -> dict[int, Follow]:
+        """
+        批量获取关注用户.
+
+        Args:
+            user_ids: 用户ID列表
+
+        Returns:
+            用户ID到关注实例的映射
+        """
+        if not user_ids:
+            return {}
+
+        with self.get_session() as session:
+            result = session.execute(
+                select(Follow).where(Follow.user_id.in_(user_ids))
+            ).scalars().all()
+            return {follow.user_id: follow for follow in result}
+
+    def get_existing_user_ids(self, user_ids: list[int]) -> set[int]:
+        """
+        获取已存在的关注用户ID.
+
+        Args:
+            user_ids: 待检查的用户ID列表
+
+        Returns:
+            已存在的用户ID集合
+        """
+        if not user_ids:
+            return set()
+
+        with self.get_session() as session:
+            result = session.execute(
+                select(Follow.user_id).where(Follow.user_id.in_(user_ids))
+            ).scalars().all()
+            return set(result)
+
+    def get_all_user_ids(self) -> list[int]:
+        """
+        获取所有关注用户的ID.
+
+        Returns:
+            用户ID列表
+        """
+        with self.get_session() as session:
+            result = session.execute(select(Follow.user_id)).scalars().all()
+            return list(result)
+
     def get_stats(self) -> dict[str, Any]:
         """获取关注统计."""
 
-        seven_days_ago = datetime.now() - timedelta(days=7)
-        thirty_days_ago = datetime.now() - timedelta(days=30)
+        now = datetime.now()
+        seven_days_ago = now - timedelta(days=7)
+        thirty_days_ago = now - timedelta(days=30)
 
         with self.get_session() as session:
             # 总关注用户数
@@ -240,10 +330,33 @@ class FollowRepository(BaseRepository[Follow]):
                 return instance
             return None
 
+    def batch_update(self, updates: list[dict]) -> int:
+        """
+        批量更新关注（一个事务内按主键executemany）.
+
+        Args:
+            updates: 更新数据列表，每项需包含id及要更新的字段
+
+        Returns:
+            更新的关注数量
+        """
+        if not updates:
+            return 0
+
+        with self.get_session() as session:
+            for start in range(0, len(updates), BATCH_CHUNK_SIZE):
+                session.execute(
+                    update(Follow),
+                    updates[start:start + BATCH_CHUNK_SIZE]
+                )
+            return len(updates)
+
     def batch_create(self, follows_data: list[dict]) -> int:
         """
         批量创建关注.
 
+        按块预查已存在的user_id，其余数据以executemany方式一次性插入.
+
         Args:
             follows_data: 关注数据列表
 
@@ -252,18 +365,27 @@ class FollowRepository(BaseRepository[Follow]):
         """
         created_count = 0
         with self.get_session() as session:
-            for data in follows_data:
-                user_id = data['user_id']
-
-                # 去重检查
-                existing = session.execute(
-                    select(Follow).where(Follow.user_id == user_id)
-                ).scalar_one_or_none()
-
-                if not existing:
-                    follow = Follow(**data)
-                    session.add(follow)
-                    created_count += 1
+            for start in range(0, len(follows_data), BATCH_CHUNK_SIZE):
+                chunk = follows_data[start:start + BATCH_CHUNK_SIZE]
+
+                # 去重检查（数据库中已存在 + 本批次内重复）
+                existing = set(session.execute(
+                    select(Follow.user_id).where(
+                        Follow.user_id.in_(
+                            {data['user_id'] for data in chunk}
+                        )
+                    )
+                ).scalars().all())
+                rows = []
+                for data in chunk:
+                    if data['user_id'] in existing:
+                        continue
+                    existing.add(data['user_id'])
+                    rows.append(data)
+
+                if rows:
+                    session.execute(insert(Follow), rows)
+                    created_count += len(rows)
 
             return created_count
 
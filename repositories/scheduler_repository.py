@@ -70,6 +70,20 @@ class SchedulerRepository(BaseRepository[SchedulerConfig]):
             result = session.execute(query).scalars().all()
             return list(result)
 
+    def get_active(self) -> list[SchedulerConfig]:
+        """
+        获取已激活的配置.
+
+        Returns:
+            配置实例列表
+        """
+        with self.get_session() as session:
+            query = select(SchedulerConfig).where(
+                SchedulerConfig.is_active.is_(True)
+            )
+            result = session.execute(query).scalars().all()
+            return list(result)
+
     def update_crontab(
         self,
         collect_type: str,
@@ -104,6 +118,46 @@ class SchedulerRepository(BaseRepository[SchedulerConfig]):
                 is_active=is_active
             )
 
+    def update_crontabs(
+        self, items: list[tuple[str, str, bool]]
+    ) -> None:
+        """
+        批量更新定时任务配置（一个事务，一次查询）.
+
+        Args:
+            items: (采集类型, crontab表达式, 是否激活)列表
+        """
+        if not items:
+            return
+
+        with self.get_session() as session:
+            existing = {
+                config.collect_type: config
+                for config in session.execute(
+                    select(SchedulerConfig).where(
+                        SchedulerConfig.collect_type.in_(
+                            [collect_type for collect_type, _, _ in items]
+                        )
+                    )
+                ).scalars()
+            }
+            now = datetime.now()
+            for collect_type, crontab_expression, is_active in items:
+                config = existing.get(collect_type)
+                if config:
+                    config.crontab_expression = crontab_expression
+                    config.is_active = is_active
+                    config.updated_at = now
+                else:
+                    # 创建新配置
+                    config = SchedulerConfig(
+                        collect_type=collect_type,
+                        crontab_expression=crontab_expression,
+                        is_active=is_active
+                    )
+                    session.add(config)
+                    existing[collect_type] = config
+
     def update_last_run_time(
         self,
         collect_type: str,
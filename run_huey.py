@@ -54,6 +54,8 @@ def main():
         scheduler_interval=1,
         periodic=True,
         check_worker_health=True,
+        # 清除异常退出时残留的任务锁（如schedule_dispatcher）
+        flush_locks=True,
     )
     logger.info("Consumer created successfully")
 
@@ -1,15 +1,26 @@
 """API密钥服务."""
-from typing import ClassVar
+import atexit
+import logging
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
 
 from models.api_key import ApiKey
 from repositories.api_key_repository import ApiKeyRepository
+from utils.time_utils import get_utc_now
+
+logger = logging.getLogger(__name__)
+
+# 密钥有效性缓存秒数（其他进程的启停最多延迟该时间生效）
+_VALIDATE_TTL = 30
+# 使用统计累积写回间隔（秒）
+_USAGE_FLUSH_INTERVAL = 5
 
 
 class ApiKeyService:
     """API密钥业务逻辑."""
 
-    _instance: ClassVar['ApiKeyService | None'] = None
-
     def __init__(self, api_key_repo: ApiKeyRepository):
         """
         初始化API密钥服务.
@@ -19,6 +30,16 @@ class ApiKeyService:
         """
         self._api_key_repo = api_key_repo
 
+        # {key: (是否有效, 过期时间)}
+        self._active_cache: dict[str, tuple[bool, float]] = {}
+        # {key: (累积次数, 最后使用时间)}
+        self._pending_usage: dict[str, tuple[int, datetime]] = {}
+        self._flush_timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+        # 进程退出前写回尚未落库的使用统计
+        atexit.register(self._flush_usage_quietly)
+
     @classmethod
     def get_instance(cls) -> 'ApiKeyService':
         """
@@ -27,15 +48,12 @@ class ApiKeyService:
         Returns:
             ApiKeyService实例
         """
-        if cls._instance is None:
-            api_key_repo = ApiKeyRepository.get_instance()
-            cls._instance = cls(api_key_repo)
-        return cls._instance
+        return _api_key_service()
 
     @classmethod
     def reset(cls) -> None:
         """重置单例实例."""
-        cls._instance = None
+        _api_key_service.cache_clear()
 
     def get_by_key(self, key: str) -> ApiKey | None:
         """
@@ -85,6 +103,7 @@ class ApiKeyService:
         Returns:
             是否删除成功
         """
+        self._active_cache.clear()
         return self._api_key_repo.delete(key_id)
 
     def toggle_status(self, key_id: int) -> ApiKey | None:
@@ -97,13 +116,88 @@ class ApiKeyService:
         Returns:
             更新后的ApiKey实例或None
         """
+        self._active_cache.clear()
         return self._api_key_repo.toggle_status(key_id)
 
-    def update_usage(self, key: str) -> None:
+    def is_active_key(self, key: str) -> bool:
+        """
+        检查API密钥是否存在且已启用（结果缓存_VALIDATE_TTL秒）.
+
+        Args:
+            key: API密钥字符串
+
+        Returns:
+            是否有效
+        """
+        now = time.monotonic()
+        cached = self._active_cache.get(key)
+        if cached and cached[1] > now:
+            return cached[0]
+
+        api_key = self._api_key_repo.get_by_key(key)
+        is_active = bool(api_key and api_key.is_active)
+        with self._lock:
+            # 无效密钥同样缓存，需限制容量防止被随机密钥撑大
+            if len(self._active_cache) >= 4096:
+                self._active_cache.clear()
+            self._active_cache[key] = (is_active, now + _VALIDATE_TTL)
+        return is_active
+
+    def record_usage(self, key: str) -> None:
         """
-        更新API密钥使用统计.
+        记录API密钥使用，累积后_USAGE_FLUSH_INTERVAL秒内批量写回.
 
         Args:
             key: API密钥字符串
         """
-        self._api_key_repo.update_usage(key)
\ No newline at end of file
+        with self._lock:
+            count, _ = self._pending_usage.get(key, (0, None))
+            self._pending_usage[key] = (count + 1, get_utc_now())
+
+            # 首次记录时启动定时写回，流量停止后最后的统计也会落库
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    _USAGE_FLUSH_INTERVAL, self._flush_usage_quietly
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush_usage(self) -> None:
+        """
+        将累积的使用统计写回数据库，写入失败时放回待写队列.
+
+        Raises:
+            Exception: 写入失败
+        """
+        with self._lock:
+            self._flush_timer = None
+            pending = self._pending_usage
+            if not pending:
+                return
+            self._pending_usage = {}
+
+        try:
+            self._api_key_repo.add_usage(pending)
+        except Exception:
+            with self._lock:
+                for key, (count, used_at) in pending.items():
+                    new_count, new_used_at = self._pending_usage.get(
+                        key, (0, used_at)
+                    )
+                    self._pending_usage[key] = (
+                        count + new_count, max(used_at, new_used_at)
+                    )
+            raise
+
+    def _flush_usage_quietly(self) -> None:
+        """定时器与退出钩子调用的写回，异常只记录日志."""
+        try:
+            self.flush_usage()
+        except Exception as e:
+            logger.error(f"Failed to flush API key usage: {e}")
+
+
+@lru_cache(maxsize=1)
+def _api_key_service() -> ApiKeyService:
+    """创建ApiKeyService单例."""
+    return ApiKeyService(ApiKeyRepository.get_instance())
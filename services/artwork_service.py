@@ -1,16 +1,27 @@
 """作品Service."""
-from typing import Any, ClassVar
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any
 
 from models.artwork import Artwork
 from repositories.artwork_repository import ArtworkRepository
 from utils.pagination import Pagination
+from utils.request_cache import request_cached
+
+# Pixiv图片原始域名
+PIXIV_IMAGE_HOST = 'https://i.pximg.net'
+
+# 公开API随机作品所需字段（一次性取出，避免逐个属性访问）
+_RANDOM_ARTWORK_FIELDS = attrgetter(
+    'illust_id', 'title', 'author_id', 'author_name', 'url',
+    'share_url', 'page_index', 'page_count', 'total_bookmarks',
+    'total_view', 'tags', 'type', 'is_r18'
+)
 
 
 class ArtworkService:
     """作品业务逻辑层."""
 
-    _instance: ClassVar['ArtworkService | None'] = None
-
     def __init__(self, artwork_repo: ArtworkRepository):
         """
         初始化Service.
@@ -28,15 +39,12 @@ class ArtworkService:
         Returns:
             ArtworkService实例
         """
-        if cls._instance is None:
-            artwork_repo = ArtworkRepository.get_instance()
-            cls._instance = cls(artwork_repo)
-        return cls._instance
+        return _artwork_service()
 
     @classmethod
     def reset(cls) -> None:
         """重置单例实例."""
-        cls._instance = None
+        _artwork_service.cache_clear()
 
     def get_artworks_by_illust_id(
         self, illust_id: int
@@ -52,6 +60,7 @@ class ArtworkService:
         """
         return self.artwork_repo.get_by_illust_id(illust_id)
 
+    @request_cached
     def get_stats(self) -> dict[str, int]:
         """获取统计信息."""
         total = self.artwork_repo.count()
@@ -121,7 +130,8 @@ class ArtworkService:
         limit: int = 10,
         is_r18: bool | None = None,
         tags_filter: str | None = None,
-        tags_match: str = 'or'
+        tags_match: str = 'or',
+        proxy_url: str | None = None
     ) -> list[dict]:
         """
         获取随机作品（用于公开API）.
@@ -131,6 +141,7 @@ class ArtworkService:
             is_r18: R18过滤
             tags_filter: 标签过滤（逗号分隔）
             tags_match: 标签匹配方式（or/and）
+            proxy_url: 图片代理地址，设置后替换图片URL的域名
 
         Returns:
             作品字典列表
@@ -142,23 +153,29 @@ class ArtworkService:
             tags_match=tags_match
         )
 
-        return [
-            {
-                'illust_id': artwork.illust_id,
-                'title': artwork.title,
-                'author_id': artwork.author_id,
-                'author_name': artwork.author_name,
-                'url': artwork.url,
-                'share_url': artwork.share_url,
-                'page': f'{artwork.page_index + 1} / {artwork.page_count}',
-                'total_bookmarks': artwork.total_bookmarks,
-                'total_view': artwork.total_view,
-                'tags': artwork.tags if isinstance(artwork.tags, list) else [],
-                'type': artwork.type,
-                'is_r18': artwork.is_r18
-            }
-            for artwork in artworks
-        ]
+        result = []
+        for (
+            illust_id, title, author_id, author_name, url, share_url,
+            page_index, page_count, total_bookmarks, total_view,
+            tags, artwork_type, is_r18_value
+        ) in map(_RANDOM_ARTWORK_FIELDS, artworks):
+            if proxy_url:
+                url = url.replace(PIXIV_IMAGE_HOST, proxy_url)
+            result.append({
+                'illust_id': illust_id,
+                'title': title,
+                'author_id': author_id,
+                'author_name': author_name,
+                'url': url,
+                'share_url': share_url,
+                'page': f'{page_index + 1} / {page_count}',
+                'total_bookmarks': total_bookmarks,
+                'total_view': total_view,
+                'tags': tags,
+                'type': artwork_type,
+                'is_r18': is_r18_value
+            })
+        return result
 
     def mark_page_invalid(
         self, artwork_id: int, reason: str
@@ -191,6 +208,7 @@ class ArtworkService:
         """
         return self.artwork_repo.mark_illust_invalid(illust_id, reason)
 
+    @request_cached
     def get_dashboard_stats(self) -> dict[str, int]:
         """
         获取dashboard统计信息.
@@ -244,18 +262,25 @@ class ArtworkService:
         """
         return self.artwork_repo.count_r18()
 
-    def search_artworks_raw(self, **kwargs) -> list:
+    def search_artworks_raw(
+        self, page: int = 1, per_page: int = 20, **kwargs
+    ) -> list:
         """
-        获取原始作品列表（用于统计）.
+        获取原始作品列表（用于统计，不统计总数）.
 
         Args:
+            page: 页码
+            per_page: 每页数量
             **kwargs: 查询参数
 
         Returns:
             作品列表
         """
-        pagination = self.artwork_repo.search_artworks(**kwargs)
-        return pagination.items
+        return self.artwork_repo.list_artworks(
+            limit=per_page,
+            offset=(page - 1) * per_page,
+            **kwargs
+        )
 
     def restore_page(
         self, artwork_id: int
@@ -297,3 +322,9 @@ class ArtworkService:
             删除的作品数量
         """
         return self.artwork_repo.delete_by_author_id(author_id)
+
+
+@lru_cache(maxsize=1)
+def _artwork_service() -> ArtworkService:
+    """创建ArtworkService单例."""
+    return ArtworkService(ArtworkRepository.get_instance())
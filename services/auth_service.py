@@ -1,5 +1,5 @@
 """Web认证服务."""
-from typing import ClassVar
+from functools import lru_cache
 
 from models.user import User
 from repositories.user_repository import UserRepository
@@ -8,8 +8,6 @@ from repositories.user_repository import UserRepository
 class AuthService:
     """Web认证业务逻辑."""
 
-    _instance: ClassVar['AuthService | None'] = None
-
     def __init__(self, user_repo: UserRepository):
         """
         初始化认证服务.
@@ -27,15 +25,12 @@ class AuthService:
         Returns:
             AuthService实例
         """
-        if cls._instance is None:
-            user_repo = UserRepository.get_instance()
-            cls._instance = cls(user_repo)
-        return cls._instance
+        return _auth_service()
 
     @classmethod
     def reset(cls) -> None:
         """重置单例实例."""
-        cls._instance = None
+        _auth_service.cache_clear()
 
     def authenticate(
         self, username: str, password: str
@@ -97,3 +92,9 @@ class AuthService:
     def has_users(self) -> bool:
         """检查是否有用户."""
         return self._user_repo.count() > 0
+
+
+@lru_cache(maxsize=1)
+def _auth_service() -> AuthService:
+    """创建AuthService单例."""
+    return AuthService(UserRepository.get_instance())
@@ -1,14 +1,14 @@
 """采集日志Service."""
-from typing import ClassVar
+from functools import lru_cache
 
+from models.collection_log import CollectionLog
 from repositories.collection_repository import CollectionRepository
+from utils.pagination import Pagination
 
 
 class CollectionService:
     """采集日志业务逻辑层."""
 
-    _instance: ClassVar['CollectionService | None'] = None
-
     def __init__(self, collection_repo: CollectionRepository):
         """
         初始化Service.
@@ -26,15 +26,12 @@ class CollectionService:
         Returns:
             CollectionService实例
         """
-        if cls._instance is None:
-            collection_repo = CollectionRepository.get_instance()
-            cls._instance = cls(collection_repo)
-        return cls._instance
+        return _collection_service()
 
     @classmethod
     def reset(cls) -> None:
         """重置单例实例."""
-        cls._instance = None
+        _collection_service.cache_clear()
 
     def get_recent_logs(self, limit: int = 100) -> list:
         """
@@ -61,4 +58,53 @@ class CollectionService:
         Returns:
             日志实例列表
         """
-        return self._collection_repo.get_by_type(log_type, limit)
\ No newline at end of file
+        return self._collection_repo.get_by_type(log_type, limit)
+
+    def create_log(
+        self, log_type: str, status: str, message: str,
+        artworks_count: int = 0
+    ) -> CollectionLog:
+        """
+        创建采集日志.
+
+        Args:
+            log_type: 日志类型
+            status: 状态
+            message: 消息
+            artworks_count: 作品数量
+
+        Returns:
+            日志实例
+        """
+        return self._collection_repo.create_log(
+            log_type, status, message, artworks_count
+        )
+
+    def get_logs_page(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        log_type_filter: str | None = None,
+        status_filter: str | None = None
+    ) -> Pagination:
+        """
+        分页获取采集日志.
+
+        Args:
+            page: 页码
+            per_page: 每页数量
+            log_type_filter: 日志类型过滤
+            status_filter: 状态过滤
+
+        Returns:
+            分页结果
+        """
+        return self._collection_repo.get_logs_page(
+            page, per_page, log_type_filter, status_filter
+        )
+
+
+@lru_cache(maxsize=1)
+def _collection_service() -> CollectionService:
+    """创建CollectionService单例."""
+    return CollectionService(CollectionRepository.get_instance())
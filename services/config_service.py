@@ -1,15 +1,27 @@
 """配置Service."""
+from collections.abc import Callable
 from datetime import datetime
-from typing import Any, ClassVar
+from functools import lru_cache
+from typing import Any
 
 from repositories.config_repository import ConfigRepository
+from utils.request_cache import clear_request_cache, request_cached
+
+# 按value_type分派的字符串解析器
+_PARSERS: dict[
+    str, Callable[[str], str | int | float | bool | datetime]
+] = {
+    'integer': int,
+    'float': float,
+    'boolean': lambda s: s == 'true',
+    'datetime': datetime.fromisoformat,
+    'string': lambda s: s,
+}
 
 
 class ConfigService:
     """配置业务逻辑层."""
 
-    _instance: ClassVar['ConfigService | None'] = None
-
     def __init__(self, config_repo: ConfigRepository):
         """
         初始化Service.
@@ -28,29 +40,39 @@ class ConfigService:
         Returns:
             ConfigService实例
         """
-        if cls._instance is None:
-            config_repo = ConfigRepository.get_instance()
-            cls._instance = cls(config_repo)
-        return cls._instance
+        return _config_service()
 
     @classmethod
     def reset(cls) -> None:
         """重置单例实例."""
-        cls._instance = None
+        _config_service.cache_clear()
 
-    def _clear_cache(self, config_key: str | None = None) -> None:
+    def invalidate_all(self) -> None:
+        """清除全部配置缓存（用于表结构变更或外部直接改库后）."""
+        self._cache.clear()
+        clear_request_cache()
+
+    def _update_cache(
+        self, config_key: str, value_str: str | None, value_type: str
+    ) -> None:
         """
-        清除配置缓存.
+        写入成功后就地更新缓存，避免下次读取重新查询全表.
 
         Args:
-            config_key: 配置键，None则清除所有
+            config_key: 配置键
+            value_str: 已存储的字符串值
+            value_type: 类型
         """
-        if config_key:
-            # 清除单个配置缓存
-            self._cache.pop(config_key, None)
-        # 清除全部配置缓存
-        self._cache.pop('all', None)
-
+        # 按存储值反解析，保证与从数据库读取的结果一致
+        value = self._str_to_value(value_str, value_type)
+        self._cache[config_key] = value
+        all_config = self._cache.get('all')
+        if all_config is not None:
+            all_config[config_key] = value
+        # 同一请求内后续读取需要看到新值
+        clear_request_cache()
+
+    @request_cached
     def get_all_config(self) -> dict[str, Any]:
         """
         获取所有配置（带缓存和自动转换）.
@@ -60,32 +82,52 @@ class ConfigService:
             cached: dict = self._cache['all']
             return cached
 
-        with self.config_repo.get_session() as session:
-            from sqlalchemy import select
+        # 只查询三列，按value_type自动转换（解析器直接查表，不逐行走方法调用）
+        parsers = _PARSERS
+        result: dict[str, Any] = {
+            config_key: (
+                None if config_value is None
+                else parsers.get(value_type, str)(config_value)
+            )
+            for config_key, config_value, value_type
+            in self.config_repo.get_all_raw()
+        }
+
+        # 存入缓存
+        self._cache['all'] = result
+        return result
 
-            from models.system_config import SystemConfig
+    def get_typed(self, config_key: str, default: Any = None) -> Any:
+        """
+        获取单个配置（带缓存和自动转换）.
 
-            configs = session.execute(
-                select(SystemConfig)
-            ).scalars().all()
+        只在首次读取时查询该键，不加载全部配置.
 
-            # 按value_type自动转换
-            result: dict[str, Any] = {}
-            for config in configs:
-                result[config.config_key] = self._str_to_value(
-                    config.config_value,
-                    config.value_type
-                )
+        Args:
+            config_key: 配置键
+            default: 配置不存在或值为None时的默认值
 
-            # 存入缓存
-            self._cache['all'] = result
-            return result
+        Returns:
+            配置值
+        """
+        if config_key in self._cache:
+            value = self._cache[config_key]
+        elif 'all' in self._cache:
+            value = self._cache['all'].get(config_key)
+        else:
+            config = self.config_repo.get_by_key(config_key)
+            value = (
+                self._str_to_value(config.config_value, config.value_type)
+                if config else None
+            )
+            self._cache[config_key] = value
+        return default if value is None else value
 
     def set_config(
         self, config_key: str, value: Any
     ) -> bool:
         """
-        设置配置并清除缓存.
+        设置配置并同步更新缓存.
 
         Args:
             config_key: 配置键
@@ -101,20 +143,36 @@ class ConfigService:
         # 保存到数据库（repo 内部完成所有操作）
         config = self.config_repo.set_config(config_key, value_str, value_type)
 
-        # 清除相关缓存
-        self._clear_cache(config_key)
+        if config is None:
+            return False
 
-        return config is not None
+        # 同步更新缓存
+        self._update_cache(config_key, value_str, value_type)
+        return True
 
-    def batch_set_config(self, config_data: dict) -> None:
+    def batch_set_config(self, config_data: dict) -> bool:
         """
-        批量设置配置.
+        批量设置配置（单事务提交）.
 
         Args:
             config_data: 配置字典
+
+        Returns:
+            是否成功
         """
+        items = []
         for key, value in config_data.items():
-            self.set_config(key, value)
+            value_type = self._infer_value_type(value)
+            items.append(
+                (key, self._value_to_str(value, value_type), value_type)
+            )
+
+        self.config_repo.batch_set_config(items)
+
+        # 同步更新缓存
+        for key, value_str, value_type in items:
+            self._update_cache(key, value_str, value_type)
+        return True
 
     def save_tokens(
         self, access_token: str | None, refresh_token: str,
@@ -131,19 +189,14 @@ class ConfigService:
         Returns:
             是否成功
         """
-        success = True
+        config_data: dict[str, Any] = {'refresh_token': refresh_token}
         # 明确检查None，允许空字符串
         if access_token is not None:
-            success = success and self.set_config(
-                'access_token', access_token
-            )
-        success = success and self.set_config(
-            'refresh_token', refresh_token
-        )
+            config_data['access_token'] = access_token
         # 如果提供了user_id，也保存
         if user_id is not None:
-            success = success and self.save_user_id(user_id)
-        return success
+            config_data['pixiv_user'] = user_id
+        return self.batch_set_config(config_data)
 
     def save_user_id(self, user_id: int) -> bool:
         """
@@ -164,10 +217,7 @@ class ConfigService:
         Returns:
             用户ID或None
         """
-        # 直接从缓存获取（已自动转换）
-        config = self.get_all_config()
-        user_id = config.get('pixiv_user') or '0'
-        return int(user_id)
+        return int(self.get_typed('pixiv_user') or 0)
 
     def clear_user_id(self) -> bool:
         """
@@ -178,6 +228,7 @@ class ConfigService:
         """
         return self.set_config('pixiv_user', '')
 
+    @request_cached
     def get_token_expiry(self) -> datetime | None:
         """
         获取token过期时间（自动转换）.
@@ -185,9 +236,8 @@ class ConfigService:
         Returns:
             过期时间或None
         """
-        # 直接从缓存获取（已自动转换）
-        config = self.get_all_config()
-        return config.get('token_expires_at')
+        expiry: datetime | None = self.get_typed('token_expires_at')
+        return expiry
 
     def set_token_expiry(self, expiry: datetime) -> bool:
         """
@@ -249,7 +299,7 @@ class ConfigService:
         elif value_type == 'datetime':
             if not isinstance(value, datetime):
                 raise TypeError('Expected datetime for datetime type')
-            return value.strftime('%Y-%m-%d %H:%M:%S')
+            return value.isoformat(sep=' ', timespec='seconds')
         else:
             return str(value)
 
@@ -268,15 +318,13 @@ class ConfigService:
         """
         if value_str is None:
             return None
-        elif value_type == 'integer':
-            return int(value_str)
-        elif value_type == 'float':
-            return float(value_str)
-        elif value_type == 'boolean':
-            return value_str == 'true'
-        elif value_type == 'datetime':
-            return datetime.strptime(
-                value_str, '%Y-%m-%d %H:%M:%S'
-            )
-        else:
+        parser = _PARSERS.get(value_type)
+        if parser is None:
             return value_str
+        return parser(value_str)
+
+
+@lru_cache(maxsize=1)
+def _config_service() -> ConfigService:
+    """创建ConfigService单例."""
+    return ConfigService(ConfigRepository.get_instance())
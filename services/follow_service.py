@@ -1,15 +1,14 @@
 """关注Service."""
-from typing import ClassVar
+from functools import lru_cache
 
 from repositories.follow_repository import FollowRepository
 from utils.pagination import Pagination
+from utils.request_cache import request_cached
 
 
 class FollowService:
     """关注业务逻辑层."""
 
-    _instance: ClassVar['FollowService | None'] = None
-
     def __init__(self, follow_repo: FollowRepository):
         """
         初始化Service.
@@ -27,16 +26,14 @@ class FollowService:
         Returns:
             FollowService实例
         """
-        if cls._instance is None:
-            follow_repo = FollowRepository.get_instance()
-            cls._instance = cls(follow_repo)
-        return cls._instance
+        return _follow_service()
 
     @classmethod
     def reset(cls) -> None:
         """重置单例实例."""
-        cls._instance = None
+        _follow_service.cache_clear()
 
+    @request_cached
     def get_active_users(self, limit: int = 10) -> list[dict]:
         """
         获取最活跃用户列表.
@@ -47,9 +44,9 @@ class FollowService:
         Returns:
             用户字典列表
         """
-        follows = self.follow_repo.get_active_users(limit)
-        return [follow.to_dict() for follow in follows]
+        return self.follow_repo.get_active_users_dicts(limit)
 
+    @request_cached
     def get_stats(self) -> dict[str, int]:
         """获取关注统计."""
         return self.follow_repo.get_stats()
@@ -101,6 +98,15 @@ class FollowService:
         """
         return self.follow_repo.get_by_user_id(user_id)
 
+    def get_all_user_ids(self) -> list[int]:
+        """
+        获取所有关注用户的ID.
+
+        Returns:
+            用户ID列表
+        """
+        return self.follow_repo.get_all_user_ids()
+
     def delete_by_user_id(self, user_id: int) -> bool:
         """
         根据用户ID删除关注.
@@ -112,3 +118,9 @@ class FollowService:
             是否删除成功
         """
         return self.follow_repo.delete_by_user_id(user_id)
+
+
+@lru_cache(maxsize=1)
+def _follow_service() -> FollowService:
+    """创建FollowService单例."""
+    return FollowService(FollowRepository.get_instance())
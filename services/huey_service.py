@@ -1,145 +1,142 @@
 """Huey异步任务服务."""
+import calendar
 import logging
+import time
+from collections.abc import Callable
 from datetime import datetime
+from functools import lru_cache
+from typing import TypedDict
 
 from croniter import croniter
 from huey import crontab
+from pixivpy3 import PixivError
+from requests import RequestException
 
 from config import Config
-from core.huey import huey
+from core.huey import enqueue_many, huey
 from services import services
 from utils.task_tracker import track_task
 
 logger = logging.getLogger(__name__)
 
+# 预期内的网络/API错误，只记录消息不输出堆栈
+_EXPECTED_ERRORS = (PixivError, RequestException)
 
-def init():
-    logger.info('register task')
+# 定时任务配置缓存时间（秒），Web进程修改配置后最迟该时长后生效
+_SCHEDULER_CONFIG_TTL = 300
+# 读取配置失败后的重试间隔（秒），连续失败时指数退避
+_SCHEDULER_RETRY_MIN = 60
+_SCHEDULER_RETRY_MAX = 900
 
 
-def _get_pixiv_service():
-    """获取PixivService实例."""
-    return services.pixiv
+class _SchedulerConfigCache(TypedDict):
+    loaded_at: float
+    configs: list | None
+    retry_at: float
+    retry_delay: float
 
 
-@huey.task(expires=Config.HUEY_RESULT_TIMEOUT)
-@track_task
-def collect_daily_rank_task() -> dict:
-    """
-    异步采集每日排行榜.
+_scheduler_config_cache: _SchedulerConfigCache = {
+    'loaded_at': 0.0,
+    'configs': None,
+    'retry_at': 0.0,
+    'retry_delay': _SCHEDULER_RETRY_MIN,
+}
 
-    Returns:
-        采集结果
-    """
-    pixiv_service = _get_pixiv_service()
-    if not pixiv_service:
-        return {'success': False, 'message': 'Pixiv service not initialized'}
 
-    try:
-        result: dict = pixiv_service.collect_daily_rank()
-        return result
-    except Exception as e:
-        logger.error(
-            f"Daily rank collection task failed: {e}",
-            exc_info=True
-        )
-        return {'success': False, 'message': str(e)}
+def init():
+    logger.info('register task')
 
 
-@huey.task(expires=Config.HUEY_RESULT_TIMEOUT)
-@track_task
-def collect_weekly_rank_task() -> dict:
-    """
-    异步采集每周排行榜.
+def _get_pixiv_service():
+    """获取PixivService实例."""
+    return services.pixiv
 
-    Returns:
-        采集结果
-    """
-    pixiv_service = _get_pixiv_service()
-    if not pixiv_service:
-        return {'success': False, 'message': 'Pixiv service not initialized'}
 
-    try:
-        result: dict = pixiv_service.collect_weekly_rank()
-        return result
-    except Exception as e:
-        logger.error(
-            f"Weekly rank collection task failed: {e}",
-            exc_info=True
-        )
-        return {'success': False, 'message': str(e)}
+# 通过_make_task生成的任务所调用的PixivService方法名
+_TASK_METHODS: list[str] = []
+# 已绑定的PixivService方法，Worker启动时解析一次
+_BOUND_METHODS: dict[str, Callable[[], dict]] = {}
 
 
-@huey.task(expires=Config.HUEY_RESULT_TIMEOUT)
-@track_task
-def collect_monthly_rank_task() -> dict:
-    """
-    异步采集每月排行榜.
-
-    Returns:
-        采集结果
+def _get_bound_method(method_name: str) -> Callable[[], dict] | None:
     """
-    pixiv_service = _get_pixiv_service()
-    if not pixiv_service:
-        return {'success': False, 'message': 'Pixiv service not initialized'}
+    获取已绑定的PixivService方法，未绑定时尝试解析.
 
-    try:
-        result: dict = pixiv_service.collect_monthly_rank()
-        return result
-    except Exception as e:
-        logger.error(
-            f"Monthly rank collection task failed: {e}",
-            exc_info=True
-        )
-        return {'success': False, 'message': str(e)}
-
-
-@huey.task(expires=Config.HUEY_RESULT_TIMEOUT)
-@track_task
-def collect_custom_rank_task() -> dict:
-    """
-    异步采集关键词排行榜.
+    Args:
+        method_name: PixivService方法名
 
     Returns:
-        采集结果
+        绑定方法，Pixiv服务未初始化时返回None
     """
-    pixiv_service = _get_pixiv_service()
-    if not pixiv_service:
-        return {'success': False, 'message': 'Pixiv service not initialized'}
-
-    try:
-        result: dict = pixiv_service.collect_custom_rank()
-        return result
-    except Exception as e:
-        logger.error(
-            f"Custom rank collection task failed: {e}",
-            exc_info=True
-        )
-        return {'success': False, 'message': str(e)}
-
-
-@huey.task(expires=Config.HUEY_RESULT_TIMEOUT)
-@track_task
-def sync_follows_task() -> dict:
+    method = _BOUND_METHODS.get(method_name)
+    if method is None:
+        pixiv_service = _get_pixiv_service()
+        if not pixiv_service:
+            return None
+        method = getattr(pixiv_service, method_name)
+        _BOUND_METHODS[method_name] = method
+    return method
+
+
+def _make_task(
+    task_name: str, method_name: str, label: str, doc: str
+):
     """
-    异步同步关注列表.
+    生成调用PixivService无参方法的Huey任务.
+
+    Args:
+        task_name: 任务名（同时作为Huey注册名和任务追踪键）
+        method_name: PixivService方法名
+        label: 日志中的任务描述
+        doc: 任务说明
 
     Returns:
-        同步结果
+        Huey任务
     """
-    pixiv_service = _get_pixiv_service()
-    if not pixiv_service:
-        return {'success': False, 'message': 'Pixiv service not initialized'}
+    def task() -> dict:
+        method = _get_bound_method(method_name)
+        if method is None:
+            return {
+                'success': False,
+                'message': 'Pixiv service not initialized'
+            }
 
-    try:
-        result: dict = pixiv_service.sync_follows()
-        return result
-    except Exception as e:
-        logger.error(
-            f"Follows sync task failed: {e}",
-            exc_info=True
-        )
-        return {'success': False, 'message': str(e)}
+        try:
+            return method()
+        except _EXPECTED_ERRORS as e:
+            logger.warning(f"{label} task failed: {e}")
+            return {'success': False, 'message': str(e)}
+        except Exception as e:
+            logger.error(f"{label} task failed: {e}", exc_info=True)
+            return {'success': False, 'message': str(e)}
+
+    task.__name__ = task.__qualname__ = task_name
+    task.__doc__ = doc
+    _TASK_METHODS.append(method_name)
+    return huey.task(expires=Config.HUEY_RESULT_TIMEOUT)(track_task(task))
+
+
+collect_daily_rank_task = _make_task(
+    'collect_daily_rank_task', 'collect_daily_rank',
+    'Daily rank collection', '异步采集每日排行榜.'
+)
+collect_weekly_rank_task = _make_task(
+    'collect_weekly_rank_task', 'collect_weekly_rank',
+    'Weekly rank collection', '异步采集每周排行榜.'
+)
+collect_monthly_rank_task = _make_task(
+    'collect_monthly_rank_task', 'collect_monthly_rank',
+    'Monthly rank collection', '异步采集每月排行榜.'
+)
+collect_custom_rank_task = _make_task(
+    'collect_custom_rank_task', 'collect_custom_rank',
+    'Custom rank collection', '异步采集关键词排行榜.'
+)
+sync_follows_task = _make_task(
+    'sync_follows_task', 'sync_follows',
+    'Follows sync', '异步同步关注列表.'
+)
 
 
 @huey.task(expires=Config.HUEY_RESULT_TIMEOUT)
@@ -189,95 +186,70 @@ def collect_user_artworks_task(
 def collect_all_follow_artworks_task() -> dict:
     """
     异步采集所有关注用户的作品（初始全量）.
+    按用户拆分为collect_user_artworks_task，由多个Worker并行执行.
 
     Returns:
-        采集结果
+        入队结果
     """
-    pixiv_service = _get_pixiv_service()
-    if not pixiv_service:
+    if not _get_pixiv_service():
         return {'success': False, 'message': 'Pixiv service not initialized'}
 
     try:
-        result: dict = pixiv_service.collect_all_follow_artworks()
-        return result
-    except Exception as e:
-        logger.error(
-            f"All follow artworks collection task failed: {e}",
-            exc_info=True
-        )
-        return {'success': False, 'message': str(e)}
-
-
-@huey.task(expires=Config.HUEY_RESULT_TIMEOUT)
-@track_task
-def collect_follow_new_works_task() -> dict:
-    """
-    异步采集关注用户新作品.
-
-    Returns:
-        采集结果
-    """
-    pixiv_service = _get_pixiv_service()
-    if not pixiv_service:
-        return {'success': False, 'message': 'Pixiv service not initialized'}
-
-    try:
-        result: dict = pixiv_service.collect_follow_new_works()
-        return result
-    except Exception as e:
-        logger.error(
-            f"Follow new works collection task failed: {e}",
-            exc_info=True
+        user_ids = services.follow.get_all_user_ids()
+        enqueue_many([
+            collect_user_artworks_task.s(user_id) for user_id in user_ids
+        ])
+        logger.info(f"Enqueued artworks collection for {len(user_ids)} users")
+        # 各用户的采集结果分别记录，这里记录一条汇总
+        services.collection.create_log(
+            log_type='follow_user_artworks',
+            status='success',
+            message=(
+                f'Enqueued artworks collection for {len(user_ids)} users'
+            )
         )
-        return {'success': False, 'message': str(e)}
-
-
-@huey.task(expires=Config.HUEY_RESULT_TIMEOUT)
-@track_task
-def update_artworks_task() -> dict:
-    """
-    异步更新作品元数据.
-
-    Returns:
-        更新结果
-    """
-    pixiv_service = _get_pixiv_service()
-    if not pixiv_service:
-        return {'success': False, 'message': 'Pixiv service not initialized'}
-
-    try:
-        result: dict = pixiv_service.update_artworks()
-        return result
+        return {
+            'success': True,
+            'message': f'已提交 {len(user_ids)} 个用户的采集任务',
+            'count': len(user_ids)
+        }
     except Exception as e:
         logger.error(
-            f"Artworks update task failed: {e}",
+            f"All follow artworks collection task failed: {e}",
             exc_info=True
         )
+        try:
+            services.collection.create_log(
+                log_type='follow_user_artworks',
+                status='failed',
+                message=f'Failed to enqueue artworks collection: {e}'
+            )
+        except Exception as log_error:
+            logger.error(f"Failed to write collection log: {log_error}")
         return {'success': False, 'message': str(e)}
 
 
-@huey.task(expires=Config.HUEY_RESULT_TIMEOUT)
-@track_task
-def cleanup_logs_task() -> dict:
-    """
-    异步清理旧日志.
-
-    Returns:
-        清理结果
-    """
-    pixiv_service = _get_pixiv_service()
-    if not pixiv_service:
-        return {'success': False, 'message': 'Pixiv service not initialized'}
-
-    try:
-        result: dict = pixiv_service.clean_up_old_logs()
-        return result
-    except Exception as e:
-        logger.error(
-            f"Logs cleanup task failed: {e}",
-            exc_info=True
-        )
-        return {'success': False, 'message': str(e)}
+collect_follow_new_works_task = _make_task(
+    'collect_follow_new_works_task', 'collect_follow_new_works',
+    'Follow new works collection', '异步采集关注用户新作品.'
+)
+update_artworks_task = _make_task(
+    'update_artworks_task', 'update_artworks',
+    'Artworks update', '异步更新作品元数据.'
+)
+cleanup_logs_task = _make_task(
+    'cleanup_logs_task', 'clean_up_old_logs',
+    'Logs cleanup', '异步清理旧日志.'
+)
+
+
+@huey.on_startup()
+def _bind_pixiv_methods() -> None:
+    """Worker启动时预先绑定PixivService方法（服务未初始化时延迟到首次调用）."""
+    for method_name in _TASK_METHODS:
+        if _get_bound_method(method_name) is None:
+            logger.info('Pixiv service not initialized, bind on first call')
+            return
 
 
 @huey.task(expires=Config.HUEY_RESULT_TIMEOUT)
@@ -331,37 +303,15 @@ def get_task_status(task_id: str) -> dict:
     Returns:
         任务状态信息
     """
+    # 只需一次Redis读取；Huey存储层不保存任务元数据，无法关联采集日志
     result = huey.result(task_id)
 
-    # 获取任务元数据
-    metadata = None
-    try:
-        task = huey.storage.get_task(task_id)
-        if task:
-            metadata = task.metadata
-    except Exception:
-        pass
-
-    # 获取关联的采集日志
-    recent_logs = services.collection.get_recent_logs(100)
-
-    # 尝试找到与任务关联的日志
-    log = None
-    if metadata and 'log_type' in metadata:
-        task_logs = [
-            log_item for log_item in recent_logs
-            if log_item.log_type == metadata['log_type'] and
-            log_item.status in ('running', 'pending')
-        ]
-        if task_logs:
-            log = task_logs[0]
-
     return {
         'task_id': task_id,
         'status': 'running' if result is None else 'completed',
         'result': result,
-        'metadata': metadata,
-        'log': log.to_dict() if log else None
+        'metadata': None,
+        'log': None
     }
 
 
@@ -375,14 +325,7 @@ def _get_task_function(collect_type: str):
     Returns:
         任务函数或None
     """
-    task_mapping = {
-        'ranking_works': _execute_ranking_tasks,
-        'follow_new_follow': sync_follows_task,
-        'follow_new_works': collect_follow_new_works_task,
-        'update_artworks': update_artworks_task,
-        'clean_up_logs': cleanup_logs_task,
-    }
-    return task_mapping.get(collect_type)
+    return _TASK_MAPPING.get(collect_type)
 
 
 def _execute_ranking_tasks():
@@ -393,93 +336,152 @@ def _execute_ranking_tasks():
         # ('monthly', collect_monthly_rank_task)
         ('custom', collect_custom_rank_task)
     ]
-    for rank_type, task_func in tasks:
-        try:
-            logger.info(f"Executing {rank_type} rank collection")
-            task_func()
-        except Exception as e:
-            logger.error(
-                f"{rank_type.capitalize()} rank collection failed: {e}",
-                exc_info=True
-            )
+    rank_types = ', '.join(rank_type for rank_type, _ in tasks)
+    try:
+        logger.info(f"Executing rank collection: {rank_types}")
+        # 一次Redis往返提交全部排行榜任务
+        enqueue_many([task_func.s() for _, task_func in tasks])
+    except Exception as e:
+        logger.error(
+            f"Rank collection ({rank_types}) failed: {e}",
+            exc_info=True
+        )
 
 
-def _update_job_run_time(job_id: str) -> None:
+# 定时任务类型与任务函数的映射
+_TASK_MAPPING = {
+    'ranking_works': _execute_ranking_tasks,
+    'follow_new_follow': sync_follows_task,
+    'follow_new_works': collect_follow_new_works_task,
+    'update_artworks': update_artworks_task,
+    'clean_up_logs': cleanup_logs_task,
+}
+# 已提示过的未知任务类型，避免每分钟重复告警
+_unknown_job_types: set[str] = set()
+
+
+def _update_job_run_time(job_id: str, run_time: datetime) -> None:
     """
     更新任务最后执行时间.
 
+    同步写入数据库：若排在长时间采集任务之后异步写入，
+    配置缓存过期重新加载时会读到旧值而重复入队.
+
     Args:
         job_id: 任务ID
+        run_time: 执行时间
     """
     try:
-        services.scheduler.update_last_run_time(job_id, datetime.now())
+        services.scheduler.update_last_run_time(job_id, run_time)
         logger.info(f"Updated run time for job: {job_id}")
     except Exception as e:
         logger.error(f"Failed to update run time for {job_id}: {e}")
 
 
+def _get_scheduler_configs() -> list:
+    """
+    获取已激活的定时任务配置（带TTL的进程内缓存）.
+
+    读取失败后在退避时间内直接返回空列表，不再访问数据库.
+
+    Returns:
+        任务配置列表
+    """
+    now = time.monotonic()
+    cache = _scheduler_config_cache
+    configs = cache['configs']
+    if (configs is None
+            or now - cache['loaded_at'] > _SCHEDULER_CONFIG_TTL):
+        if now < cache['retry_at']:
+            return []
+        try:
+            configs = services.scheduler.get_active_configs()
+        except Exception:
+            cache['retry_at'] = now + cache['retry_delay']
+            cache['retry_delay'] = min(
+                cache['retry_delay'] * 2, _SCHEDULER_RETRY_MAX
+            )
+            raise
+        cache['configs'] = configs
+        cache['loaded_at'] = now
+        cache['retry_delay'] = _SCHEDULER_RETRY_MIN
+    return configs
+
+
+@lru_cache(maxsize=512)
+def _expected_next_run(
+    crontab_expression: str, last_run_time: datetime
+) -> float:
+    """
+    计算基于上次执行时间的下一次应该执行的时间.
+
+    Args:
+        crontab_expression: cron表达式
+        last_run_time: 上次执行时间
+
+    Returns:
+        预期执行时间戳（与croniter一致，本地时间按UTC换算）
+    """
+    next_run: float = croniter(
+        crontab_expression, last_run_time
+    ).get_next(float)
+    return next_run
+
+
 @huey.periodic_task(crontab(), expires=Config.HUEY_RESULT_TIMEOUT)
+@huey.lock_task('schedule_dispatcher')
 @track_task
 def schedule_dispatcher_task():
     """
     动态定时任务分发器 - 每分钟执行一次.
     从数据库读取任务配置，根据cron表达式调度执行相应任务.
+    上一次分发未结束时跳过本次执行，避免重复入队.
     """
 
     try:
-        configs = services.scheduler.get_all_configs()
-
+        configs = _get_scheduler_configs()
         if not configs:
             return
 
         current_time = datetime.now()
+        # 与croniter相同，将本地时间按UTC换算为时间戳以便直接比较
+        current_ts = calendar.timegm(current_time.timetuple())
 
         for config in configs:
-            if not config.is_active:
-                continue
-
             # 获取任务函数
             task_func = _get_task_function(config.collect_type)
             if not task_func:
-                logger.warning(f"Unknown job type: {config.collect_type}")
+                if config.collect_type not in _unknown_job_types:
+                    _unknown_job_types.add(config.collect_type)
+                    logger.warning(
+                        f"Unknown job type: {config.collect_type}"
+                    )
                 continue
 
-            # 使用croniter计算下次执行时间
             try:
-                cron = croniter(config.crontab_expression, current_time)
-                cron.get_next(datetime)
-
-                # 如果上次执行时间为空，
-                # 或者下次执行时间在当前时间之前（包括当前分钟）
-                should_run = False
-                if config.last_run_time is None:
-                    should_run = True
-                else:
-                    # 计算基于上次执行时间的下一次应该执行的时间
-                    cron_prev = croniter(
-                        config.crontab_expression,
-                        config.last_run_time
+                # 上次执行时间为空，或当前时间已超过预期执行时间，则应该执行
+                should_run = (
+                    config.last_run_time is None
+                    or current_ts >= _expected_next_run(
+                        config.crontab_expression, config.last_run_time
                     )
-                    expected_next = cron_prev.get_next(datetime)
-                    # 如果当前时间已经超过了预期执行时间，则应该执行
-                    if current_time >= expected_next:
-                        should_run = True
+                )
 
                 if should_run:
                     logger.info(
                         f"Executing scheduled task: {config.collect_type}"
                     )
                     try:
-                        # 调用任务函数
-                        if config.collect_type == 'ranking_works':
-                            # 排行榜任务执行后更新时间
-                            _execute_ranking_tasks()
-                        else:
-                            # 其他任务异步执行
-                            task_func()
-
-                        # 更新最后执行时间
-                        _update_job_run_time(config.collect_type)
+                        # 先更新最后执行时间（同步更新缓存中的配置），
+                        # 避免重叠的分发重复入队
+                        _update_job_run_time(
+                            config.collect_type, current_time
+                        )
+                        config.last_run_time = current_time
+
+                        # 调用任务函数（异步入队）
+                        task_func()
+
                         logger.info(
                             f"Task {config.collect_type} executed successfully"
                         )
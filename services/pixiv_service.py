@@ -1,12 +1,18 @@
 """Pixiv采集和更新服务."""
 import logging
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, date, datetime, timedelta
-from typing import Any, ClassVar
+from typing import Any, ClassVar, NamedTuple
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 
+from config import Config
+from models.artwork import Artwork
 from models.follow import Follow
-from repositories.artwork_repository import ArtworkRepository
+from repositories.artwork_repository import ArtworkRepository, ArtworkRow
 from repositories.collection_repository import CollectionRepository
 from repositories.follow_repository import FollowRepository
 from services.config_service import ConfigService
@@ -16,6 +22,67 @@ from utils.time_utils import get_utc_now
 
 logger = logging.getLogger(__name__)
 
+# 作品详情请求的令牌消耗（单个作品的轻量请求，按1/4个令牌计）
+DETAIL_REQUEST_COST = 0.25
+
+# 配置快照有效期（秒），Web进程修改配置后Worker最迟该时长后读到新值
+_CONFIG_TTL = 60
+
+# rank_date按当天零点保存
+_MIDNIGHT = datetime.min.time()
+
+# 从next_url中提取offset参数
+_OFFSET_RE = re.compile(r'[?&]offset=(\d+)')
+
+# AI生成作品标签（小写）
+_AI_TAGS = frozenset(tag.lower() for tag in (
+    'AI生成',
+    'AI-illust',
+    'AIart',
+    'AIイラスト',
+    'AI绘画',
+    'AIArt',
+    'NovelAI',
+    'Stable Diffusion',
+    'Midjourney',
+))
+
+# R18标签（R-18/R18/R-18G/R18G，不区分大小写）
+_R18_RE = re.compile(r'R-?18', re.IGNORECASE)
+
+
+class FollowArtworkResult(NamedTuple):
+    """单个关注作品的处理结果."""
+
+    artworks: list[ArtworkRow]
+    is_new: bool
+    backlog_count: int
+
+
+class FollowPageResult(NamedTuple):
+    """一页关注作品的处理结果."""
+
+    artworks: list[ArtworkRow]
+    new_users_count: int
+    backlog_count: int
+    has_more: bool
+
+
+def _parse_pixiv_datetime(value: str) -> datetime:
+    """
+    解析Pixiv API返回的带时区日期字符串.
+
+    Args:
+        value: 日期字符串（如 2024-01-01T12:00:00+09:00）
+
+    Returns:
+        带时区的日期时间
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, '%Y-%m-%dT%H:%M:%S%z')
+
 
 class PixivService:
     """Pixiv业务服务（整合采集和更新功能）."""
@@ -51,6 +118,15 @@ class PixivService:
         self._client = pixiv_client
         self._limiter = rate_limiter
 
+        # 配置快照，过期或reload_components后重新读取
+        self._config_cache: dict[str, Any] | None = None
+        self._config_loaded_at = 0.0
+        # 由配置快照解析出的过滤作者，随快照一起失效
+        self._filtered_authors: set[int] | None = None
+
+        # 串行化token刷新，避免并发采集时重复刷新
+        self._refresh_lock = threading.Lock()
+
     @classmethod
     def get_instance(cls) -> 'PixivService | None':
         """
@@ -98,7 +174,7 @@ class PixivService:
     def _init_client_and_limiter(self) -> None:
         """内部初始化client和limiter."""
         # 获取配置
-        config_dict = self._config_service.get_all_config()
+        config_dict = self._get_config()
         access_token = str(config_dict.get('access_token') or '')
         refresh_token = str(config_dict.get('refresh_token') or '')
         if not refresh_token:
@@ -110,6 +186,7 @@ class PixivService:
         # 初始化RateLimiter
         delay_min = float(config_dict.get('api_delay_min') or 1.0)
         delay_max = float(config_dict.get('api_delay_max') or 3.0)
+        burst = int(config_dict.get('api_burst') or 1)
         error_delay_429_min = float(
             config_dict.get('error_delay_429_min') or 30.0
         )
@@ -138,26 +215,27 @@ class PixivService:
             error_delay_403_max=error_delay_403_max,
             error_delay_other_min=error_delay_other_min,
             error_delay_other_max=error_delay_other_max,
+            burst=burst,
         )
 
         # 初始化PixivClient，传入user_id
         self._client = PixivClient(access_token, refresh_token, user_id)
 
-        # 从数据库加载token_expiry
-        token_expiry_str = str(config_dict.get('token_expires_at') or '')
-        if token_expiry_str:
+        # 从数据库加载token_expiry（配置按datetime类型读取时已完成解析）
+        token_expiry = config_dict.get('token_expires_at')
+        if isinstance(token_expiry, str) and token_expiry:
             try:
-                self._client.token_expiry = datetime.strptime(
-                    token_expiry_str, '%Y-%m-%d %H:%M:%S'
-                )
-                logger.info(
-                    f"Token expiry loaded: {self._client.token_expiry}"
-                )
-            except (ValueError, TypeError) as e:
+                token_expiry = datetime.fromisoformat(token_expiry)
+            except ValueError as e:
                 logger.warning(
                     f"Failed to parse token_expiry: {e}"
                 )
-                self._client.token_expiry = None
+                token_expiry = None
+        if isinstance(token_expiry, datetime):
+            self._client.token_expiry = token_expiry
+            logger.info(
+                f"Token expiry loaded: {self._client.token_expiry}"
+            )
         else:
             self._client.token_expiry = None
 
@@ -183,8 +261,30 @@ class PixivService:
         """重新加载client和limiter（配置更新后调用）."""
         self._client = None
         self._limiter = None
+        self._config_cache = None
+        self._filtered_authors = None
         logger.info("Pixiv components will be reloaded on next access")
 
+    def _get_config(self) -> dict[str, Any]:
+        """
+        获取配置快照（首次访问、过期或重新加载后读取）.
+
+        Returns:
+            配置字典
+        """
+        now = time.monotonic()
+        if (
+            self._config_cache is None
+            or now - self._config_loaded_at > _CONFIG_TTL
+        ):
+            if self._config_cache is not None:
+                # 快照过期：丢弃进程内缓存，从数据库读取最新配置
+                self._config_service.invalidate_all()
+            self._config_cache = self._config_service.get_all_config()
+            self._config_loaded_at = now
+            self._filtered_authors = None
+        return self._config_cache
+
     def _parse_create_date(self, create_date: str) -> datetime:
         """
         解析作品创建日期（UTC）.
@@ -195,10 +295,7 @@ class PixivService:
         Returns:
             UTC 日期时间
         """
-        post_date_with_tz = datetime.strptime(
-            create_date,
-            '%Y-%m-%dT%H:%M:%S%z'
-        )
+        post_date_with_tz = _parse_pixiv_datetime(create_date)
         return post_date_with_tz.astimezone(UTC).replace(tzinfo=None)
 
     def _parse_create_date_with_local(
@@ -213,10 +310,7 @@ class PixivService:
         Returns:
             (UTC 日期时间, 本地日期)
         """
-        post_date_with_tz = datetime.strptime(
-            create_date,
-            '%Y-%m-%dT%H:%M:%S%z'
-        )
+        post_date_with_tz = _parse_pixiv_datetime(create_date)
         post_date = post_date_with_tz.astimezone(UTC).replace(tzinfo=None)
         rank_date = post_date_with_tz.astimezone().date()
         return post_date, rank_date
@@ -234,6 +328,10 @@ class PixivService:
         if not next_url:
             return 0
 
+        match = _OFFSET_RE.search(next_url)
+        if match:
+            return int(match.group(1))
+
         qs = self.client.parse_qs(next_url)
         offset = int(qs.get('offset') or 0) if qs else 0
         return offset
@@ -249,47 +347,64 @@ class PixivService:
         Returns:
             配置值
         """
-        config_dict = self._config_service.get_all_config()
-        return config_dict.get(key, default)
+        return self._get_config().get(key, default)
+
+    def _is_token_valid(self) -> bool:
+        """
+        检查本地记录的token是否仍在有效期内.
+
+        Returns:
+            是否有效
+        """
+        expiry = self._config_service.get_token_expiry()
+        if not expiry or expiry <= get_utc_now():
+            logger.warning(
+                f"Token expired at UTC:{expiry or 'N/A'}, "
+                f"refreshing..."
+            )
+            return False
+
+        if not self.client.user_id:
+            logger.debug(
+                f"Token is valid until {expiry}, "
+                f"but user_id is empty, refresh"
+            )
+            return False
+
+        logger.debug(f"Token is valid until {expiry}")
+        return True
 
     def _ensure_valid_token(self) -> None:
         """确保token有效，过期则自动刷新并保存到数据库."""
-        # 1. 检查本地有效期（数据库）
-        expiry = self._config_service.get_token_expiry()
-        now = get_utc_now()
+        # 1. 检查本地有效期（数据库），有效则直接返回
+        if self._is_token_valid():
+            return
 
-        # 2. 如果有效期有效，直接返回
-        if expiry and expiry > now:
-            if not self.client.user_id:
-                logger.debug(
-                    f"Token is valid until {expiry}, "
-                    f"but user_id is empty, refresh"
-                )
-            else:
-                logger.debug(f"Token is valid until {expiry}")
+        with self._refresh_lock:
+            # 2. 等待锁期间其他线程可能已完成刷新
+            if self._is_token_valid():
                 return
 
-        # 3. 过期则刷新
-        logger.warning(
-            f"Token expired at UTC:{expiry or 'N/A'}, "
-            f"refreshing..."
-        )
-        self.client.refresh_tokens()
-        # 4. 保存新token（access_token + refresh_token + user_id + expiry）
-        new_expiry = now + timedelta(hours=1)
-        self._config_service.save_tokens(
-            self.client.access_token,
-            self.client.refresh_token,
-            self.client.user_id
-        )
-        self._config_service.set_token_expiry(new_expiry)
+            # 3. 过期则刷新
+            now = get_utc_now()
+            self.client.refresh_tokens()
+            # 4. 保存新token（access_token + refresh_token + user_id + expiry）
+            new_expiry = now + timedelta(hours=1)
+            self._config_service.save_tokens(
+                self.client.access_token,
+                self.client.refresh_token,
+                self.client.user_id
+            )
+            self._config_service.set_token_expiry(new_expiry)
 
-        # 8. 验证token（调用一次user_detail）
-        try:
-            self.client.verify_token()
-            logger.info(f"Token verified, valid until UTC:{new_expiry}")
-        except Exception as e:
-            logger.warning(f"Token verification failed after refresh: {e}")
+            # 5. 验证token（调用一次user_detail）
+            try:
+                self.client.verify_token()
+                logger.info(f"Token verified, valid until UTC:{new_expiry}")
+            except Exception as e:
+                logger.warning(
+                    f"Token verification failed after refresh: {e}"
+                )
 
     def collect_rank(self, mode: str) -> dict:
         """
@@ -325,8 +440,8 @@ class PixivService:
                     logger.info(
                         f"Fetching {mode} ranking page {page_count}..."
                     )
+                    self.limiter.acquire()
                     rank_data = self.client.get_ranking(mode, offset=offset)
-                    self.limiter.wait()
 
                     # 验证返回数据
                     if (
@@ -348,10 +463,9 @@ class PixivService:
                     # 处理每个作品
                     for item in rank_data.illusts:
                         try:
-                            artwork_pages = self._parse_artwork(item)
-                            for artwork_data in artwork_pages:
-                                artwork_data['collect_type'] = log_type
-                                artworks_list.append(artwork_data)
+                            artworks_list.extend(
+                                self._parse_artwork(item, log_type)
+                            )
                         except Exception as e:
                             logger.error(
                                 f"Failed to parse artwork {item.id}: {e}"
@@ -517,11 +631,11 @@ class PixivService:
                     f"Searching '{keyword}' at "
                     f"page {page_count + 1}"
                 )
+                self.limiter.acquire()
                 search_result = self.client.search_illust(
                     word=keyword,
                     offset=offset
                 )
-                self.limiter.wait()
                 page_count += 1
 
                 # 检查是否有结果
@@ -554,10 +668,9 @@ class PixivService:
                     # _calculate_score内部已处理阈值，score>0表示符合条件
                     if score > 0:
                         # 解析作品数据
-                        artwork_pages = self._parse_artwork(item)
-                        for artwork_data in artwork_pages:
-                            artwork_data['collect_type'] = log_type
-                            artworks_to_save.append(artwork_data)
+                        artworks_to_save.extend(
+                            self._parse_artwork(item, log_type)
+                        )
                         qualified_count += 1
                         logger.debug(
                             f"Qualified: {item.id} (score={score:.2f})"
@@ -623,19 +736,14 @@ class PixivService:
             评分值（未达到阈值返回0）
         """
         # 获取书签数和浏览数
-        bookmark_count = 0
-        if hasattr(item, 'total_bookmarks'):
-            bookmark_count = item.total_bookmarks or 0
-
-        # 获取浏览数
-        total_view = 0
-        if hasattr(item, 'total_view'):
-            total_view = item.total_view or 0
+        bookmark_count = getattr(item, 'total_bookmarks', 0) or 0
+        total_view = getattr(item, 'total_view', 0) or 0
 
         # 获取发布时间
         post_date = None
-        if hasattr(item, 'create_date'):
-            post_date = self._parse_create_date(item.create_date)
+        create_date = getattr(item, 'create_date', None)
+        if create_date is not None:
+            post_date = self._parse_create_date(create_date)
 
         if not post_date:
             return 0.0
@@ -657,13 +765,11 @@ class PixivService:
             return 0.0
 
         # 过滤条件4: 只要插画，过滤漫画
-        artwork_type = 'illust'
-        if hasattr(item, 'type'):
-            artwork_type = item.type
-        elif hasattr(item, 'illust_type'):
-            artwork_type = item.illust_type
-
-        tags = [tag.name for tag in item.tags] if hasattr(item, 'tags') else []
+        artwork_type = getattr(
+            item, 'type', getattr(item, 'illust_type', 'illust')
+        )
+        tags_attr = getattr(item, 'tags', None)
+        tags = [tag.name for tag in tags_attr] if tags_attr else []
 
         if artwork_type != 'illust' or '漫画' in tags:
             logger.debug(
@@ -672,7 +778,7 @@ class PixivService:
             return 0.0
 
         # 过滤条件5: 超过5页的作品
-        work_page_count = item.page_count if hasattr(item, 'page_count') else 1
+        work_page_count = getattr(item, 'page_count', 1)
         if work_page_count > 5:
             logger.debug(
                 f"Skipped {item.id}: too many pages ({work_page_count})"
@@ -716,23 +822,11 @@ class PixivService:
         Returns:
             是否为AI作品
         """
-        if not hasattr(item, 'tags'):
+        tags = getattr(item, 'tags', None)
+        if not tags:
             return False
 
-        ai_tags = [
-            'AI生成',
-            'AI-illust',
-            'AIart',
-            'AIイラスト',
-            'AI绘画',
-            'AIArt',
-            'NovelAI',
-            'Stable Diffusion',
-            'Midjourney',
-        ]
-
-        tags = [tag.name.lower() for tag in item.tags]
-        return any(ai_tag.lower() in tags for ai_tag in ai_tags)
+        return any(tag.name.lower() in _AI_TAGS for tag in tags)
 
     def _is_r18(self, item) -> bool:
         """
@@ -744,19 +838,10 @@ class PixivService:
         Returns:
             是否为R18作品
         """
-        if not hasattr(item, 'tags'):
+        tags = getattr(item, 'tags', None)
+        if not tags:
             return False
-        tags = []
-        if hasattr(item, 'tags'):
-            tags = [tag.name for tag in item.tags]
-        is_r18 = False
-        r18_keywords = ['R-18', 'R18', 'R-18G', 'R18G']
-        for tag in tags:
-            t = tag.upper()
-            if any(k in t for k in r18_keywords):
-                is_r18 = True
-                break
-        return is_r18
+        return any(_R18_RE.search(tag.name) for tag in tags)
 
     def _is_too_old(self, create_date: str) -> bool:
         """
@@ -808,8 +893,8 @@ class PixivService:
             while has_more:
                 try:
                     # 获取关注列表
+                    self.limiter.acquire()
                     follows_data = self.client.get_following(offset)
-                    self.limiter.wait()
 
                     # 验证返回数据
                     if not follows_data or not hasattr(
@@ -828,15 +913,19 @@ class PixivService:
                         f"{len(follows_data.user_previews)}"
                     )
 
+                    # 一次查询本页中已存在的用户
+                    existing_ids = self._follow_repo.get_existing_user_ids([
+                        int(user_info.user.id)
+                        for user_info in follows_data.user_previews
+                    ])
+
                     # 处理每个用户
                     for user_info in follows_data.user_previews:
                         user_info_id = int(user_info.user.id)
-                        existing = self._follow_repo.get_by_user_id(
-                            user_info_id
-                        )
 
-                        if not existing:
-                            # 新关注用户
+                        if user_info_id not in existing_ids:
+                            # 新关注用户（三个时间戳取同一时刻）
+                            now = get_utc_now()
                             self._follow_repo.create(
                                 id=None,
                                 user_id=user_info_id,
@@ -846,9 +935,9 @@ class PixivService:
                                     if user_info.user.profile_image_urls
                                     else None
                                 ),
-                                first_collect_date=get_utc_now(),
-                                created_at=get_utc_now(),
-                                updated_at=get_utc_now()
+                                first_collect_date=now,
+                                created_at=now,
+                                updated_at=now
                             )
                             new_follows += 1
                             logger.info(
@@ -900,12 +989,28 @@ class PixivService:
 
     def _get_filtered_authors(self) -> set[int]:
         """
-        获取需要过滤的作者ID列表.
+        获取需要过滤的作者ID列表（随配置快照缓存）.
 
         Returns:
             作者ID集合
         """
         authors_str = self.get_config_value('filtered_authors', '')
+        if self._filtered_authors is None:
+            self._filtered_authors = self._parse_filtered_authors(
+                authors_str
+            )
+        return self._filtered_authors
+
+    def _parse_filtered_authors(self, authors_str: str) -> set[int]:
+        """
+        解析过滤作者配置.
+
+        Args:
+            authors_str: 作者ID字符串
+
+        Returns:
+            作者ID集合
+        """
         if not authors_str:
             return set()
 
@@ -928,60 +1033,59 @@ class PixivService:
             logger.warning(f"Failed to parse filtered_authors: {e}")
             return set()
 
-    def _parse_artwork(self, item) -> list[dict]:
+    def _parse_artwork(
+        self, item, collect_type: str = ''
+    ) -> list[ArtworkRow]:
         """
         解析作品数据.
 
         Args:
             item: Pixiv API返回的作品项
+            collect_type: 采集类型
 
         Returns:
             解析后的作品数据列表
         """
         # 解析标签
-        tags = []
-        if hasattr(item, 'tags'):
-            tags = [tag.name for tag in item.tags]
+        tags_attr = getattr(item, 'tags', None)
+        tags = [tag.name for tag in tags_attr] if tags_attr else []
 
         # 判断R18
         is_r18 = self._is_r18(item)
 
         # 解析rank
         rank = None
-        if hasattr(item, 'rank') and item.rank:
-            rank = int(str(item.rank).split('#')[0])
+        rank_attr = getattr(item, 'rank', None)
+        if rank_attr:
+            rank = int(str(rank_attr).split('#')[0])
 
         # 解析日期
         post_date = None
         rank_date = None
-        if hasattr(item, 'create_date'):
+        create_date = getattr(item, 'create_date', None)
+        if create_date is not None:
             post_date, rank_date = self._parse_create_date_with_local(
-                item.create_date
+                create_date
             )
 
         # 解析作品类型
-        artwork_type = 'illust'
-        if hasattr(item, 'type'):
-            artwork_type = item.type
-        elif hasattr(item, 'illust_type'):
-            artwork_type = item.illust_type
+        artwork_type = getattr(
+            item, 'type', getattr(item, 'illust_type', 'illust')
+        )
 
         # 获取页数
-        page_count = item.page_count if hasattr(item, 'page_count') else 1
+        page_count = getattr(item, 'page_count', 1)
 
         # 生成分享URL
         share_url = f"https://www.pixiv.net/artworks/{item.id}"
 
         # 检查是否在过滤作者列表中
         filtered_authors = self._get_filtered_authors()
-        author_id = (
-            item.user.id
-            if hasattr(item, 'user') and item.user
-            else None
-        )
+        user = getattr(item, 'user', None)
+        author_id = user.id if user else None
 
         # 处理多图作品
-        artworks_list = []
+        artworks_list: list[ArtworkRow] = []
         is_valid = artwork_type == 'illust' and '漫画' not in tags
         err_msg = (
             artwork_type if artwork_type != 'illust' else 'Not like'
@@ -993,140 +1097,124 @@ class PixivService:
             err_msg = 'Filtered author'
             logger.debug(f"Author {author_id} is in filtered list")
 
-        if hasattr(item, 'meta_pages') and item.meta_pages:
-            # 多图作品
-            for page_index in range(page_count):
-                if page_index < len(item.meta_pages):
-                    page_url = item.meta_pages[page_index].image_urls.large
-                else:
-                    page_url = (
-                        item.image_urls.large
-                        if item.image_urls else ''
-                    )
+        # 各页共用的字段只计算一次
+        total_bookmarks = getattr(item, 'total_bookmarks', 0)
+        total_view = getattr(item, 'total_view', 0)
+        now = get_utc_now()
+        rank_datetime = (
+            datetime.combine(rank_date, _MIDNIGHT) if rank_date else None
+        )
+        is_r18 = bool(is_r18)
+        is_valid = bool(is_valid)
+        error_message = None if is_valid else err_msg
+
+        cover_url = item.image_urls.large if item.image_urls else ''
+
+        # 各页只有url和page_index不同，先构建基础数据再逐页复制
+        base: ArtworkRow = {
+            'illust_id': item.id,
+            'title': item.title,
+            'author_id': item.user.id,
+            'author_name': item.user.name,
+            'url': cover_url,
+            'share_url': share_url,
+            'page_index': 0,
+            'page_count': page_count,
+            'total_bookmarks': total_bookmarks,
+            'total_view': total_view,
+            'rank': rank,
+            'rank_date': rank_datetime,
+            'post_date': post_date,
+            'tags': tags,
+            'is_r18': is_r18,
+            'type': artwork_type,
+            'is_valid': is_valid,
+            'error_message': error_message,
+            'last_updated_at': post_date,
+            'collect_type': collect_type,
+            'created_at': now
+        }
 
-                artworks_list.append({
-                    'id': None,
-                    'illust_id': item.id,
-                    'title': item.title,
-                    'author_id': item.user.id,
-                    'author_name': item.user.name,
-                    'url': page_url,
-                    'share_url': share_url,
-                    'page_index': page_index,
-                    'page_count': page_count,
-                    'total_bookmarks': (
-                        item.total_bookmarks
-                        if hasattr(item, 'total_bookmarks') else 0
-                    ),
-                    'total_view': (
-                        item.total_view
-                        if hasattr(item, 'total_view') else 0
-                    ),
-                    'rank': rank,
-                    'rank_date': (
-                        datetime.combine(rank_date, datetime.min.time())
-                        if rank_date else None
-                    ),
-                    'post_date': post_date,
-                    'tags': tags,
-                    'is_r18': bool(is_r18),
-                    'type': artwork_type,
-                    'is_valid': bool(is_valid),
-                    'error_message': None if bool(is_valid) else err_msg,
-                    'last_updated_at': post_date,
-                    'collect_type': '',
-                    'created_at': get_utc_now()
-                })
+        meta_pages = getattr(item, 'meta_pages', None)
+        if meta_pages:
+            # 多图作品：各页URL先取出，超出meta_pages的页使用封面URL
+            page_urls = [
+                page.image_urls.large for page in meta_pages[:page_count]
+            ]
+            page_urls += [cover_url] * (page_count - len(page_urls))
+            for page_index, page_url in enumerate(page_urls):
+                page_data = base.copy()
+                page_data['page_index'] = page_index
+                page_data['url'] = page_url
+                artworks_list.append(page_data)
         else:
             # 单图作品
-            artworks_list.append({
-                'id': None,
-                'illust_id': item.id,
-                'title': item.title,
-                'author_id': item.user.id,
-                'author_name': item.user.name,
-                'url': item.image_urls.large if item.image_urls else '',
-                'share_url': share_url,
-                'page_index': 0,
-                'page_count': page_count,
-                'total_bookmarks': (
-                    item.total_bookmarks
-                    if hasattr(item, 'total_bookmarks') else 0
-                ),
-                'total_view': (
-                    item.total_view
-                    if hasattr(item, 'total_view') else 0
-                ),
-                'rank': rank,
-                'rank_date': (
-                    datetime.combine(rank_date, datetime.min.time())
-                    if rank_date
-                    else None
-                ),
-                'post_date': post_date,
-                'tags': tags,
-                'is_r18': bool(is_r18),
-                'type': artwork_type,
-                'is_valid': bool(is_valid),
-                'error_message': None if bool(is_valid) else err_msg,
-                'last_updated_at': post_date,
-                'collect_type': '',
-                'created_at': get_utc_now()
-            })
+            artworks_list.append(base)
 
         return artworks_list
 
-    def collect_single_user_artworks(
-        self, follow: Follow, backtrack_years: int = 2
-    ) -> dict:
+    def _get_user_illusts_page(self, user_id: int, offset: int, page: int):
         """
-        采集单个用户的作品.
+        获取用户作品的一页（含请求间隔等待）.
 
         Args:
-            follow: 关注实例
-            backtrack_years: 回采年限
-            force_update: 是否强制更新
+            user_id: 用户ID
+            offset: 偏移量
+            page: 页码
 
         Returns:
-            采集结果
+            用户作品数据
         """
-        self._ensure_initialized()
+        # 批量等待
+        if page > 1 and self.limiter.batch_wait(page, 5):
+            logger.info("Pause in collect_single_user_artworks")
 
-        log_type = 'follow_user_artworks'
-        log = self._collection_repo.create_log(
-            log_type=log_type,
-            status='running',
-            message=f'Starting collection for user {follow.user_name}'
-        )
+        self.limiter.acquire()
+        return self.client.get_user_illusts(user_id, offset)
 
-        try:
-            # 确保token有效
-            self._ensure_valid_token()
+    def _fetch_user_artworks(
+        self, follow: Follow, backtrack_years: int
+    ) -> tuple[list[ArtworkRow], datetime | None]:
+        """
+        分页获取单个用户回采期限内的作品（不写入数据库）.
 
-            artworks_list = []
-            collected_count = 0
-            last_artwork_date = None
+        确定需要下一页时先在后台请求，与当前页的解析重叠.
 
-            # 计算预设的回采截止日期
-            initial_cutoff_date = (
-                get_utc_now() - timedelta(days=backtrack_years * 365)
-            )
-            # 使用预设截止日期作为初始值
-            actual_cutoff_date = initial_cutoff_date
-            first_artwork_date = None
+        Args:
+            follow: 关注实例
+            backtrack_years: 回采年限
 
-            has_more = True
-            offset = 0
-            page = 1
+        Returns:
+            (作品数据列表, 最新作品日期)
+        """
+        artworks_list: list[ArtworkRow] = []
+        collected_count = 0
+        last_artwork_date = None
+
+        # 计算预设的回采截止日期
+        backtrack_delta = timedelta(days=backtrack_years * 365)
+        initial_cutoff_date = get_utc_now() - backtrack_delta
+        # 使用预设截止日期作为初始值
+        actual_cutoff_date = initial_cutoff_date
+        first_artwork_date = None
+
+        has_more = True
+        offset = 0
+        page = 1
+        next_page: Future | None = None
 
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
             while has_more:
                 try:
                     logger.info(f'collect {follow.user_name} page:{page}')
-                    # 获取用户作品
-                    user_illusts = self.client.get_user_illusts(
-                        follow.user_id, offset
-                    )
-                    self.limiter.wait()
+                    # 获取用户作品（已预取则直接取结果）
+                    if next_page is not None:
+                        user_illusts = next_page.result()
+                        next_page = None
+                    else:
+                        user_illusts = self._get_user_illusts_page(
+                            follow.user_id, offset, page
+                        )
 
                     if not user_illusts or not hasattr(
                         user_illusts, 'illusts'
@@ -1136,17 +1224,64 @@ class PixivService:
                     if not user_illusts.illusts:
                         break
 
+                    # 记录第一个作品的时间（只在首页判断一次）
+                    if first_artwork_date is None:
+                        first_create_date = getattr(
+                            user_illusts.illusts[0], 'create_date', None
+                        )
+                        if first_create_date:
+                            first_artwork_date = self._parse_create_date(
+                                first_create_date
+                            )
+                            # 如果第一个作品早于预设截止日期，调整截止日期
+                            if first_artwork_date < initial_cutoff_date:
+                                actual_cutoff_date = (
+                                    first_artwork_date - backtrack_delta
+                                )
+                                logger.info(
+                                    f'调整 cutoff_date: '
+                                    f'原始 {initial_cutoff_date} -> '
+                                    f'调整后 {actual_cutoff_date} '
+                                    f'(基于第一个作品 {first_artwork_date})'
+                                )
+
+                    # 检查是否还有更多
+                    if not user_illusts.next_url:
+                        has_more = False
+                    else:
+                        offset = self._parse_offset(user_illusts.next_url)
+                        # 本页最旧的作品仍在回采期限内，必然需要下一页，
+                        # 先在后台请求
+                        oldest_create_date = getattr(
+                            user_illusts.illusts[-1], 'create_date', None
+                        )
+                        if (
+                            oldest_create_date
+                            and self._parse_create_date(oldest_create_date)
+                            >= actual_cutoff_date
+                        ):
+                            next_page = prefetcher.submit(
+                                self._get_user_illusts_page,
+                                follow.user_id, offset, page + 1
+                            )
+
+                    # 一次查询本页已入库的作品页，已全部入库的作品不再解析
+                    existing_keys = self._artwork_repo.get_existing_page_keys(
+                        {item.id for item in user_illusts.illusts}
+                    )
+
                     new_count = 0
                     current_page_max_date = None
 
                     for item in user_illusts.illusts:
                         # 检查发布日期
                         post_date: datetime | None = None
-                        if hasattr(item, 'create_date'):
-                            # 记录原始日期用于调试
-                            original_create_date = item.create_date
+                        original_create_date = getattr(
+                            item, 'create_date', None
+                        )
+                        if original_create_date is not None:
                             post_date = self._parse_create_date(
-                                item.create_date
+                                original_create_date
                             )
 
                             # 调试日志：显示日期转换
@@ -1156,23 +1291,6 @@ class PixivService:
                                 f'parsed={post_date}'
                             )
 
-                            # 记录第一个作品的时间
-                            if first_artwork_date is None and post_date:
-                                first_artwork_date = post_date
-
-                                # 如果第一个作品早于预设截止日期，调整截止日期
-                                if post_date < initial_cutoff_date:
-                                    actual_cutoff_date = (
-                                        post_date
-                                        - timedelta(days=backtrack_years * 365)
-                                    )
-                                    logger.info(
-                                        f'调整 cutoff_date: '
-                                        f'原始 {initial_cutoff_date} -> '
-                                        f'调整后 {actual_cutoff_date} '
-                                        f'(基于第一个作品 {post_date})'
-                                    )
-
                             # 更新当前页最大日期
                             if (
                                 current_page_max_date is None
@@ -1193,12 +1311,20 @@ class PixivService:
                                 has_more = False
                                 break
 
+                        if all(
+                            (item.id, page_index) in existing_keys
+                            for page_index in range(
+                                getattr(item, 'page_count', 1)
+                            )
+                        ):
+                            continue
+
                         try:
-                            artwork_pages = self._parse_artwork(item)
-                            for artwork_data in artwork_pages:
-                                artwork_data['collect_type'] = 'follow_works'
-                                artworks_list.append(artwork_data)
-                                new_count += 1
+                            artwork_pages = self._parse_artwork(
+                                item, 'follow_works'
+                            )
+                            artworks_list.extend(artwork_pages)
+                            new_count += len(artwork_pages)
                         except Exception as e:
                             logger.error(
                                 f"Failed to parse artwork {item.id}: {e}"
@@ -1220,64 +1346,52 @@ class PixivService:
                             f'page {page} has no valid dates'
                         )
 
-                    # 检查是否还有更多
-                    if not user_illusts.next_url:
-                        has_more = False
-                    else:
-                        offset = self._parse_offset(user_illusts.next_url)
-
                     page += 1
 
-                    # 批量等待
-                    if self.limiter.batch_wait(page, 5):
-                        logger.info("Pause in collect_single_user_artworks")
-
                 except Exception as e:
                     logger.error(f"Error processing page {page}: {e}")
                     self.limiter.handle_error()
                     break
 
-            # 批量保存作品
-            saved_count = self._artwork_repo.batch_create(artworks_list)
-
-            # 使用事务上下文合并更新
-            if last_artwork_date:
-                with self._follow_repo.with_session() as session:
-                    # 重新查询获取 session 中的对象
-                    instance = session.execute(
-                        select(Follow).where(Follow.user_id == follow.user_id)
-                    ).scalar_one_or_none()
+        return artworks_list, last_artwork_date
 
-                    if instance:
-                        instance.last_artwork_date = last_artwork_date
-                        instance.last_collect_date = get_utc_now()
+    def _update_follow_collect_dates(
+        self, user_id: int, last_artwork_date: datetime
+    ) -> None:
+        """
+        更新关注用户的最新作品日期和采集日期.
 
-                        if not instance.first_collect_date:
-                            instance.first_collect_date = get_utc_now()
+        Args:
+            user_id: 用户ID
+            last_artwork_date: 最新作品日期
+        """
+        # 使用事务上下文合并更新
+        with self._follow_repo.with_session() as session:
+            # 重新查询获取 session 中的对象
+            instance = session.execute(
+                select(Follow).where(Follow.user_id == user_id)
+            ).scalar_one_or_none()
 
-                        # 自动提交
+            if instance:
+                now = get_utc_now()
+                instance.last_artwork_date = last_artwork_date
+                instance.last_collect_date = now
 
-            # 更新日志
-            self._collection_repo.update_success(
-                log.id,
-                f'Collected {saved_count} artworks from {follow.user_name}',
-                saved_count
-            )
+                if not instance.first_collect_date:
+                    instance.first_collect_date = now
 
-            return {
-                'success': True,
-                'user_name': follow.user_name,
-                'new_count': saved_count
-            }
+                # 自动提交
 
-        except Exception as e:
-            logger.error(f"Failed to collect user artworks: {e}")
-            self._collection_repo.update_error(log.id, str(e))
-            raise
-
-    def collect_all_follow_artworks(self) -> dict:
+    def collect_single_user_artworks(
+        self, follow: Follow, backtrack_years: int = 2
+    ) -> dict:
         """
-        初始全量关注采集.
+        采集单个用户的作品.
+
+        Args:
+            follow: 关注实例
+            backtrack_years: 回采年限
+            force_update: 是否强制更新
 
         Returns:
             采集结果
@@ -1288,62 +1402,40 @@ class PixivService:
         log = self._collection_repo.create_log(
             log_type=log_type,
             status='running',
-            message='Starting initial follow collection'
+            message=f'Starting collection for user {follow.user_name}'
         )
 
         try:
-            # 获取回采年限配置
-            backtrack_years = self.get_config_value(
-                'new_user_backtrack_years', 2
-            )
+            # 确保token有效
+            self._ensure_valid_token()
 
-            # 获取所有关注用户
-            follows = self._follow_repo.get_by_all()
+            artworks_list, last_artwork_date = self._fetch_user_artworks(
+                follow, backtrack_years
+            )
 
-            total_count = 0
-            success_count = 0
-            failed_users = []
+            # 批量保存作品
+            saved_count = self._artwork_repo.batch_create(artworks_list)
 
-            for follow in follows:
-                try:
-                    logger.info(f'start collecting for {follow.user_name}')
-                    result = self.collect_single_user_artworks(
-                        follow, backtrack_years
-                    )
-                    logger.info(
-                        'collect %s: total %d artworks',
-                        follow.user_name,
-                        result['new_count']
-                    )
-                    total_count += result['new_count']
-                    success_count += 1
-                except Exception as e:
-                    logger.error(
-                        f"Failed to collect for {follow.user_name}: {e}"
-                    )
-                    failed_users.append(follow.user_name)
+            if last_artwork_date:
+                self._update_follow_collect_dates(
+                    follow.user_id, last_artwork_date
+                )
 
             # 更新日志
-            message = (
-                f'Collected {total_count} artworks '
-                f'from {success_count}/{len(follows)} users'
-            )
-            if failed_users:
-                message += f', Failed: {", ".join(failed_users)}'
-
             self._collection_repo.update_success(
-                log.id, message, total_count
+                log.id,
+                f'Collected {saved_count} artworks from {follow.user_name}',
+                saved_count
             )
 
             return {
                 'success': True,
-                'total_count': total_count,
-                'success_count': success_count,
-                'failed_count': len(failed_users)
+                'user_name': follow.user_name,
+                'new_count': saved_count
             }
 
         except Exception as e:
-            logger.error(f"Failed to collect follow user artworks: {e}")
+            logger.error(f"Failed to collect user artworks: {e}")
             self._collection_repo.update_error(log.id, str(e))
             raise
 
@@ -1372,13 +1464,9 @@ class PixivService:
                 'new_user_backtrack_years', 2
             )
 
-            # 执行采集
+            # 执行采集（每页作品随页写入）
             result = self._collect_follow_works(backtrack_years)
-
-            # 批量保存作品
-            saved_count = self._artwork_repo.batch_create(
-                result['artworks_list']
-            )
+            saved_count = result['saved_count']
 
             # 构建日志消息
             message_parts = [
@@ -1418,56 +1506,94 @@ class PixivService:
         """
         采集关注用户新作品的主逻辑.
 
+        每页处理完即批量写入该页作品，不跨页累积.
+
         Args:
             backtrack_years: 回采年限
 
         Returns:
             采集结果字典
         """
-        artworks_list = []
+        saved_count = 0
         new_users_count = 0
         backlog_artworks_count = 0
         has_more = True
         offset = 0
         query_count = 1
+        # 本次采集内的关注用户缓存，同一作者的作品不重复查询
+        follows: dict[int, Follow | None] = {}
 
-        while has_more:
-            try:
-                # 获取一页数据
-                follow_data = self._fetch_follow_page(offset)
+        next_page: Future | None = None
 
-                if follow_data is None:
-                    break
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            while has_more:
+                try:
+                    # 获取一页数据（已预取则直接取结果）
+                    if next_page is not None:
+                        follow_data = next_page.result()
+                        next_page = None
+                    else:
+                        follow_data = self._fetch_follow_page(offset)
 
-                # 处理作品列表
-                result = self._process_follow_works(
-                    follow_data,
-                    backtrack_years,
-                    has_more
-                )
+                    if follow_data is None:
+                        break
 
-                # 更新统计
-                artworks_list.extend(result['artworks'])
-                new_users_count += result['new_users_count']
-                backlog_artworks_count += result['backlog_count']
-                has_more = result['has_more']
+                    query_count += 1
 
-                query_count += 1
+                    # 一次查询本页作品的首页记录
+                    existing_map = self._artwork_repo.get_map_by_illust_ids(
+                        [item.id for item in follow_data.illusts]
+                    )
 
-                # 获取下一页 offset
-                offset = self._parse_offset(follow_data.next_url)
+                    # 本页遇到已采集的作品时处理完即停止，不再预取下一页
+                    if not follow_data.next_url:
+                        has_more = False
+                    elif self._reaches_collected_artwork(existing_map):
+                        has_more = False
+                    else:
+                        offset = self._parse_offset(follow_data.next_url)
 
-                # 批量等待
-                if self.limiter.batch_wait(query_count, 5):
-                    logger.info("Pause in follow new works collection")
+                        # 批量等待
+                        if self.limiter.batch_wait(query_count, 5):
+                            logger.info(
+                                "Pause in follow new works collection"
+                            )
 
-            except Exception as e:
-                logger.error(f"Error processing page {query_count}: {e}")
-                self.limiter.handle_error()
-                break
+                        # 处理本页的同时在后台请求下一页
+                        next_page = prefetcher.submit(
+                            self._fetch_follow_page, offset
+                        )
+
+                    # 处理作品列表
+                    result = self._process_follow_works(
+                        follow_data,
+                        backtrack_years,
+                        has_more,
+                        follows,
+                        existing_map
+                    )
+
+                    # 写入本页作品并更新统计
+                    saved_count += self._artwork_repo.batch_create(
+                        result.artworks
+                    )
+                    new_users_count += result.new_users_count
+                    backlog_artworks_count += result.backlog_count
+                    has_more = result.has_more
+
+                except Exception as e:
+                    logger.error(
+                        f"Error processing page {query_count}: {e}"
+                    )
+                    self.limiter.handle_error()
+                    break
+
+            # 提前结束时取消尚未开始的预取
+            if next_page is not None:
+                next_page.cancel()
 
         return {
-            'artworks_list': artworks_list,
+            'saved_count': saved_count,
             'new_users_count': new_users_count,
             'backlog_artworks_count': backlog_artworks_count
         }
@@ -1482,11 +1608,11 @@ class PixivService:
         Returns:
             关注数据或None
         """
+        self.limiter.acquire()
         follow_data = self.client.get_follow_illusts(
             offset=offset,
             restrict='public'
         )
-        self.limiter.wait()
 
         # 验证返回数据
         if not follow_data or not hasattr(follow_data, 'illusts'):
@@ -1504,8 +1630,10 @@ class PixivService:
         self,
         follow_data,
         backtrack_years: int,
-        has_more: bool
-    ) -> dict:
+        has_more: bool,
+        follows: dict[int, Follow | None],
+        existing_map: dict[int, Artwork]
+    ) -> FollowPageResult:
         """
         处理一页关注作品.
 
@@ -1513,59 +1641,92 @@ class PixivService:
             follow_data: 关注数据
             backtrack_years: 回采年限
             has_more: 是否还有更多
+            follows: 本次采集的关注用户缓存
+            existing_map: 本页已入库作品（首页）的映射
 
         Returns:
             处理结果
         """
-        artworks: list[Any] = []
+        artworks: list[ArtworkRow] = []
         new_users_count = 0
         backlog_count = 0
 
+        # 一次查询本页中尚未缓存的作者
+        missing_ids = list({
+            item.user.id for item in follow_data.illusts
+            if item.user.id not in follows
+        })
+        if missing_ids:
+            found = self._follow_repo.get_by_user_ids(missing_ids)
+            for user_id in missing_ids:
+                follows[user_id] = found.get(user_id)
+
+        # 已有关注用户的更新按用户合并，页末一次写入
+        follow_updates: dict[int, dict] = {}
+
         for item in follow_data.illusts:
             try:
                 # 检查是否应该继续
-                should_continue = self._should_process_artwork(item, has_more)
+                should_continue = self._should_process_artwork(
+                    item, has_more, existing_map
+                )
                 if not should_continue:
-                    return {
-                        'artworks': artworks,
-                        'new_users_count': new_users_count,
-                        'backlog_count': backlog_count,
-                        'has_more': False
-                    }
+                    has_more = False
+                    break
 
                 # 处理作品
                 result = self._process_single_artwork(
-                    item, backtrack_years
+                    item, backtrack_years, follows, follow_updates
                 )
-                artworks.extend(result['artworks'])
-                new_users_count += result['is_new']
-                backlog_count += result['backlog_count']
+                artworks.extend(result.artworks)
+                new_users_count += result.is_new
+                backlog_count += result.backlog_count
 
             except Exception as e:
                 logger.error(f"Failed to parse artwork {item.id}: {e}")
                 continue
 
-        return {
-            'artworks': artworks,
-            'new_users_count': new_users_count,
-            'backlog_count': backlog_count,
-            'has_more': has_more
-        }
+        self._follow_repo.batch_update(list(follow_updates.values()))
+
+        return FollowPageResult(
+            artworks, new_users_count, backlog_count, has_more
+        )
 
-    def _should_process_artwork(self, item, has_more: bool) -> bool:
+    def _reaches_collected_artwork(
+        self, existing_map: dict[int, Artwork]
+    ) -> bool:
+        """
+        判断本页是否包含会使采集停止的已入库作品.
+
+        与_should_process_artwork的停止条件一致：排行榜和自定义榜单以外的
+        已入库作品.
+
+        Args:
+            existing_map: 本页已入库作品（首页）的映射
+
+        Returns:
+            处理本页时是否会停止
+        """
+        return any(
+            artwork.collect_type not in {'ranking_works', 'custom_rank'}
+            for artwork in existing_map.values()
+        )
+
+    def _should_process_artwork(
+        self, item, has_more: bool, existing_map: dict[int, Artwork]
+    ) -> bool:
         """
         判断是否应该处理作品.
 
         Args:
             item: 作品项
             has_more: 是否还有更多
+            existing_map: 本页已入库作品（首页）的映射
 
         Returns:
             是否应该处理
         """
-        existing = self._artwork_repo.get_by_illust_id_and_page(
-            item.id, 0
-        )
+        existing = existing_map.get(item.id)
 
         if not existing:
             return True
@@ -1581,7 +1742,7 @@ class PixivService:
             return False
 
         # 官方排行榜和自定义榜单：因为这是用户作品，更新为 follow_works
-        if collect_type in ['ranking_works', 'custom_rank']:
+        if collect_type in {'ranking_works', 'custom_rank'}:
             logger.info(
                 f"作品 {item.id} 类型为 {collect_type}，"
                 f"更新为 follow_works（用户作品）"
@@ -1598,70 +1759,65 @@ class PixivService:
         return False
 
     def _process_single_artwork(
-        self, item, backtrack_years: int
-    ) -> dict:
+        self, item, backtrack_years: int,
+        follows: dict[int, Follow | None],
+        follow_updates: dict[int, dict]
+    ) -> FollowArtworkResult:
         """
         处理单个关注作品.
 
         Args:
             item: 作品项
             backtrack_years: 回采年限
+            follows: 本次采集的关注用户缓存
+            follow_updates: 本页待写入的关注更新
 
         Returns:
             处理结果
         """
         # 解析作品
-        artwork_pages = self._parse_artwork(item)
+        artworks = self._parse_artwork(item, 'follow_works')
         user_id = item.user.id
 
         # 获取或创建用户
-        follow = self._follow_repo.get_by_user_id(user_id)
+        if user_id in follows:
+            follow = follows[user_id]
+        else:
+            follow = self._follow_repo.get_by_user_id(user_id)
 
         # 处理用户
         is_new, backlog_count = self._process_user_from_artwork(
-            item, follow, backtrack_years
+            item, follow, backtrack_years, follow_updates
         )
+        if is_new:
+            # 新建的用户下次需重新查询
+            follows.pop(user_id, None)
 
-        # 设置作品类型
-        artworks = []
-        for artwork_data in artwork_pages:
-            artwork_data['collect_type'] = 'follow_works'
-            artworks.append(artwork_data)
-
-        return {
-            'artworks': artworks,
-            'is_new': is_new,
-            'backlog_count': backlog_count
-        }
+        return FollowArtworkResult(artworks, is_new, backlog_count)
 
     def _save_artwork_all_page(self, log_type, item) -> int:
-        new_count = 0
-        artwork_pages = self._parse_artwork(item)
-        for artwork_data in artwork_pages:
-            artwork_data['collect_type'] = log_type
-            existing = self._artwork_repo.get_by_illust_id_and_page(
-                item.id,
-                artwork_data.get('page_index', 0)
-            )
-            if not existing:
-                saved = self._artwork_repo.create(**artwork_data)
-                if saved:
-                    new_count += 1
-        return new_count
+        # 一次查询去重，未入库的页一条executemany写入
+        return self._artwork_repo.batch_create(
+            self._parse_artwork(item, log_type)
+        )
 
     def _process_user_from_artwork(
         self,
         item,
         follow: Follow | None,
-        backtrack_years: int
+        backtrack_years: int,
+        follow_updates: dict[int, dict]
     ) -> tuple[bool, int]:
         """
         从作品项处理用户（更新或创建）.
 
+        已有用户的更新合并到follow_updates中，由调用方批量写入.
+
         Args:
             item: 作品项
             follow: Follow对象或None
             backtrack_years: 回采年限
+            follow_updates: 按关注ID合并的待写入更新
 
         Returns:
             (是否为新用户, 补充的作品数)
@@ -1669,42 +1825,38 @@ class PixivService:
         user_id = item.user.id
 
         if follow:
-            # 使用事务上下文，所有操作在同一 session 中
-            with self._follow_repo.with_session() as session:
-                # 重新查询获取 session 中的对象
-                instance = session.execute(
-                    select(Follow).where(Follow.user_id == user_id)
-                ).scalar_one_or_none()
-
-                if not instance:
-                    return (False, 0)
-
-                # 更新基本信息
-                instance.user_name = item.user.name
-                if item.user.profile_image_urls:
-                    instance.avatar_url = (
-                        item.user.profile_image_urls.medium
-                    )
+            update_data = follow_updates.setdefault(
+                follow.id, {'id': follow.id}
+            )
 
-                # 更新最后作品时间
-                artwork_pages = self._parse_artwork(item)
-                if artwork_pages:
-                    artwork_date = artwork_pages[0]['post_date']
-                    artwork_name = artwork_pages[0]['title']
-                    logger.debug(
-                        f'get {item.user.name} art_work:'
-                        f'{artwork_name}-{artwork_date} '
-                        f'record time:{instance.last_artwork_date}'
-                    )
-                    if (
-                        instance.last_artwork_date is None
-                        or artwork_date > instance.last_artwork_date
-                    ):
-                        instance.last_artwork_date = artwork_date
+            # 更新基本信息
+            update_data['user_name'] = item.user.name
+            if item.user.profile_image_urls:
+                update_data['avatar_url'] = (
+                    item.user.profile_image_urls.medium
+                )
 
-                # 更新采集时间
-                instance.last_collect_date = get_utc_now()
-                instance.updated_at = get_utc_now()
+            # 更新最后作品时间（只需发布日期，不必解析整个作品）
+            create_date = getattr(item, 'create_date', None)
+            if create_date is not None:
+                artwork_date = self._parse_create_date(create_date)
+                logger.debug(
+                    f'get {item.user.name} art_work:'
+                    f'{item.title}-{artwork_date} '
+                    f'record time:{follow.last_artwork_date}'
+                )
+                if (
+                    follow.last_artwork_date is None
+                    or artwork_date > follow.last_artwork_date
+                ):
+                    # 同步缓存中的对象，供同一次采集的后续作品比较
+                    follow.last_artwork_date = artwork_date
+                    update_data['last_artwork_date'] = artwork_date
+
+            # 更新采集时间
+            now = get_utc_now()
+            update_data['last_collect_date'] = now
+            update_data['updated_at'] = now
 
             return (False, 0)
         else:
@@ -1714,6 +1866,7 @@ class PixivService:
 
             try:
                 # 创建 Follow 记录
+                now = get_utc_now()
                 follow = self._follow_repo.create(
                     user_id=user_id,
                     user_name=item.user.name,
@@ -1722,9 +1875,9 @@ class PixivService:
                         if item.user.profile_image_urls
                         else None
                     ),
-                    first_collect_date=get_utc_now(),
-                    created_at=get_utc_now(),
-                    updated_at=get_utc_now()
+                    first_collect_date=now,
+                    created_at=now,
+                    updated_at=now
                 )
                 logger.info(f"已添加新用户: {item.user.name} (ID: {user_id})")
 
@@ -1773,37 +1926,165 @@ class PixivService:
 
         return None
 
-    def _handle_invalid_artwork(
-        self, illust_id: int, invalid_action: str
+    def _handle_invalid_artworks(
+        self, illust_ids: set[int], invalid_action: str
     ) -> None:
         """
-        处理失效作品的统一方法.
+        批量处理失效作品（每种策略一条语句）.
 
         Args:
-            illust_id: 作品ID
+            illust_ids: 作品ID集合
             invalid_action: 处理策略 ('mark' 或 'delete')
         """
+        if not illust_ids:
+            return
+
         if invalid_action == 'delete':
-            # 删除该作品的所有页
-            deleted = self._artwork_repo.delete_by_illust_id(
-                illust_id
+            # 删除这些作品的所有页
+            deleted = self._artwork_repo.delete_by_illust_ids(illust_ids)
+            logger.info(
+                f'Deleted {deleted} pages for '
+                f'{len(illust_ids)} artworks'
             )
-            if deleted:
-                logger.info(
-                    f'Deleted {deleted} pages for '
-                    f'artwork {illust_id}'
-                )
         else:
             # 默认策略：标记为失效
-            marked = self._artwork_repo.mark_illust_invalid(
-                illust_id,
+            marked = self._artwork_repo.mark_illusts_invalid(
+                illust_ids,
                 '作品已从Pixiv删除'
             )
-            if marked:
+            logger.info(
+                f'Marked {marked} pages as invalid for '
+                f'{len(illust_ids)} artworks'
+            )
+
+    def _fetch_illust_detail(
+        self, illust_id: int
+    ) -> tuple[Any, Exception | None]:
+        """
+        获取作品详情（在线程池中执行，不访问数据库）.
+
+        Args:
+            illust_id: 作品ID
+
+        Returns:
+            (作品详情, 请求异常)
+        """
+        logger.debug(f'update artwork={illust_id}')
+        self.limiter.acquire(DETAIL_REQUEST_COST)
+        try:
+            detail = self.client.get_illust_detail(illust_id)
+        except Exception as e:
+            return None, e
+        return detail, None
+
+    def _fetch_illust_details(
+        self, executor: ThreadPoolExecutor, illust_ids: list[int]
+    ) -> dict[int, tuple[Any, Exception | None]]:
+        """
+        并行获取一组作品详情.
+
+        Args:
+            executor: 线程池
+            illust_ids: 作品ID列表（不重复）
+
+        Returns:
+            作品ID到(作品详情, 请求异常)的映射
+        """
+        return dict(zip(
+            illust_ids,
+            executor.map(self._fetch_illust_detail, illust_ids),
+            strict=True
+        ))
+
+    def _apply_artwork_detail(
+        self,
+        illust_id: int,
+        pages: list[Row],
+        detail: Any,
+        api_error: Exception | None,
+        updates: list[dict],
+        invalid_ids: set[int],
+        updated_at: datetime
+    ) -> tuple[int, int]:
+        """
+        根据作品详情处理该作品的各页.
+
+        书签数和浏览数的变更追加到updates中，失效作品加入invalid_ids，
+        均由调用方统一写入.
+
+        Args:
+            illust_id: 作品ID
+            pages: 已加载的该作品各页
+            detail: 作品详情
+            api_error: 获取详情时的异常
+            updates: 待写入的更新数据列表
+            invalid_ids: 失效作品ID集合
+            updated_at: 本次更新时间
+
+        Returns:
+            (更新的页数, 失效的页数)
+        """
+        if api_error is not None:
+            # 捕获API调用的异常
+            error_code = self._extract_error_code(api_error)
+
+            # 判断错误类型
+            if error_code in {429, 403}:
+                # 速率限制错误：跳过并应用延迟
+                logger.warning(
+                    f'Skipped {illust_id} due to '
+                    f'{error_code} error (rate limit), '
+                    f'will retry later'
+                )
+                self.limiter.handle_error(error_code)
+                return 0, 0
+            elif error_code == 404:
+                # 作品不存在：标记为失效
                 logger.info(
-                    f'Marked {marked} pages as invalid for '
-                    f'artwork {illust_id}'
+                    f'{illust_id} not found (404), '
+                    'marking as invalid'
+                )
+                invalid_ids.add(illust_id)
+                return 0, len(pages)
+            else:
+                # 其他错误：记录日志并跳过
+                logger.error(
+                    f'Failed to get detail for '
+                    f'{illust_id}: '
+                    f'{api_error} (code: {error_code})'
                 )
+                self.limiter.handle_error(error_code)
+                return 0, 0
+
+        # 检查是否获取到详情
+        if not detail or not hasattr(detail, 'illust'):
+            logger.info(
+                f'{illust_id} detail is empty, '
+                'treating as not found'
+            )
+            # 标记为失效
+            invalid_ids.add(illust_id)
+            return 0, len(pages)
+
+        item = detail.illust
+
+        # 更新书签数和浏览数（各页相同）
+        new_bookmarks = getattr(item, 'total_bookmarks', 0)
+        new_view = getattr(item, 'total_view', 0)
+        updated = 0
+        for page in pages:
+            if (
+                new_bookmarks != page.total_bookmarks or
+                new_view != page.total_view
+            ):
+                updates.append({
+                    'id': page.id,
+                    'total_bookmarks': new_bookmarks,
+                    'total_view': new_view,
+                    'last_updated_at': updated_at
+                })
+                updated += 1
+        return updated, 0
 
     def update_artworks(self) -> dict:
         """
@@ -1854,104 +2135,51 @@ class PixivService:
             logger.info(
                 f'update artworks invalid_action={invalid_action}'
             )
+            # 书签数和浏览数的变更，最后在一个事务内批量写入
+            updates: list[dict] = []
+            # 失效作品，最后按处理策略一次处理
+            invalid_ids: set[int] = set()
+            # 同一次运行的作品使用相同的更新时间
+            updated_at = get_utc_now()
+
+            # 多图作品的各页共用一次详情请求
+            pages_map: dict[int, list[Row]] = {}
             for artwork in artworks:
-                try:
-                    processed_count += 1
-                    # 获取作品详情
-                    logger.debug(
-                        f'update artwork={artwork.illust_id}-{artwork.title}'
+                pages_map.setdefault(artwork.illust_id, []).append(artwork)
+            illust_ids = list(pages_map)
+
+            # 详情请求按并发数分组并行执行，数据库写入仍在当前线程
+            concurrency = max(1, Config.PIXIV_UPDATE_CONCURRENCY)
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for start in range(0, len(illust_ids), concurrency):
+                    chunk_ids = illust_ids[start:start + concurrency]
+                    details = self._fetch_illust_details(
+                        executor, chunk_ids
                     )
-
-                    try:
-                        detail = self.client.get_illust_detail(
-                            artwork.illust_id
-                        )
-                        self.limiter.fast_wait(0.1, 0.5)
-
-                        # 检查是否获取到详情
-                        if not detail or not hasattr(detail, 'illust'):
-                            logger.info(
-                                f'{artwork.illust_id} detail is empty, '
-                                'treating as not found'
-                            )
-                            # 标记为失效
-                            self._handle_invalid_artwork(
-                                artwork.illust_id, invalid_action
-                            )
-                            invalid_count += 1
-                            continue
-
-                    except Exception as api_error:
-                        # 捕获API调用的异常
-                        error_code = self._extract_error_code(api_error)
-
-                        # 判断错误类型
-                        if error_code in [429, 403]:
-                            # 速率限制错误：跳过并应用延迟
-                            logger.warning(
-                                f'Skipped {artwork.illust_id} due to '
-                                f'{error_code} error (rate limit), '
-                                f'will retry later'
-                            )
-                            self.limiter.handle_error(error_code)
-                            continue
-                        elif error_code == 404:
-                            # 作品不存在：标记为失效
-                            logger.info(
-                                f'{artwork.illust_id} not found (404), '
-                                'marking as invalid'
-                            )
-                            self._handle_invalid_artwork(
-                                artwork.illust_id, invalid_action
+                    for illust_id in chunk_ids:
+                        pages = pages_map[illust_id]
+                        processed_count += len(pages)
+                        detail, api_error = details[illust_id]
+                        try:
+                            updated, invalid = self._apply_artwork_detail(
+                                illust_id, pages, detail, api_error,
+                                updates, invalid_ids, updated_at
                             )
-                            invalid_count += 1
-                            continue
-                        else:
-                            # 其他错误：记录日志并跳过
+                            updated_count += updated
+                            invalid_count += invalid
+                        except Exception as e:
                             logger.error(
-                                f'Failed to get detail for '
-                                f'{artwork.illust_id}: '
-                                f'{api_error} (code: {error_code})'
+                                f'Failed to update artwork '
+                                f'{illust_id}: {e}'
                             )
-                            self.limiter.handle_error(error_code)
-                            continue
 
-                    item = detail.illust
-
-                    # 更新书签数和浏览数
-                    new_bookmarks = (
-                        item.total_bookmarks
-                        if hasattr(item, 'total_bookmarks') else 0
-                    )
-                    new_view = (
-                        item.total_view
-                        if hasattr(item, 'total_view') else 0
+                    logger.info(
+                        'update_artworks progress:%.2f%%',
+                        processed_count / len(artworks) * 100
                     )
 
-                    if (
-                        new_bookmarks != artwork.total_bookmarks or
-                        new_view != artwork.total_view
-                    ):
-                        self._artwork_repo.update(
-                            artwork.id,
-                            total_bookmarks=new_bookmarks,
-                            total_view=new_view,
-                            last_updated_at=get_utc_now()
-                        )
-                        updated_count += 1
-                    if processed_count % 10 == 0:
-                        self.limiter.wait()
-                        logger.info(
-                            'update_artworks progress:%.2f%%',
-                            processed_count / len(artworks) * 100
-                        )
-
-                except Exception as e:
-                    logger.error(
-                        f'Failed to update artwork '
-                        f'{artwork.illust_id}: {e}'
-                    )
-                    continue
+            self._artwork_repo.batch_update_stats(updates)
+            self._handle_invalid_artworks(invalid_ids, invalid_action)
 
             # 构建日志消息
             message_parts = [f'Updated {updated_count} artworks']
@@ -1,5 +1,6 @@
 """定时任务Service."""
 from datetime import datetime
+from functools import lru_cache
 from typing import ClassVar
 
 from repositories.scheduler_repository import SchedulerRepository
@@ -8,7 +9,14 @@ from repositories.scheduler_repository import SchedulerRepository
 class SchedulerService:
     """定时任务业务逻辑层."""
 
-    _instance: ClassVar['SchedulerService | None'] = None
+    # 支持的定时任务类型
+    VALID_JOB_TYPES: ClassVar[frozenset[str]] = frozenset({
+        'ranking_works',
+        'follow_new_follow',
+        'follow_new_works',
+        'update_artworks',
+        'clean_up_logs'
+    })
 
     def __init__(self, scheduler_repo: SchedulerRepository):
         """
@@ -27,15 +35,12 @@ class SchedulerService:
         Returns:
             SchedulerService实例
         """
-        if cls._instance is None:
-            scheduler_repo = SchedulerRepository.get_instance()
-            cls._instance = cls(scheduler_repo)
-        return cls._instance
+        return _scheduler_service()
 
     @classmethod
     def reset(cls) -> None:
         """重置单例实例."""
-        cls._instance = None
+        _scheduler_service.cache_clear()
 
     def get_all_configs(self) -> list:
         """
@@ -46,6 +51,15 @@ class SchedulerService:
         """
         return self._scheduler_repo.get_all()
 
+    def get_active_configs(self) -> list:
+        """
+        获取已激活的定时任务配置.
+
+        Returns:
+            配置列表
+        """
+        return self._scheduler_repo.get_active()
+
     def update_configs(self, job_configs: dict) -> None:
         """
         批量更新定时任务配置.
@@ -54,25 +68,18 @@ class SchedulerService:
             job_configs: 任务配置字典
             {job_type: {crontab_expression, is_active}}
         """
+        items = []
         for job_type, job_config in job_configs.items():
             # 验证job_type
-            valid_job_types = [
-                'ranking_works',
-                'follow_new_follow',
-                'follow_new_works',
-                'update_artworks',
-                'clean_up_logs'
-            ]
-
             if (
-                job_type in valid_job_types and
+                job_type in self.VALID_JOB_TYPES and
                 isinstance(job_config, dict)
             ):
                 crontab = job_config.get('crontab_expression') or ''
                 is_active = job_config.get('is_active', True)
-                self._scheduler_repo.update_crontab(
-                    job_type, crontab, is_active
-                )
+                items.append((job_type, crontab, is_active))
+
+        self._scheduler_repo.update_crontabs(items)
 
     def update_last_run_time(
         self, job_id: str, run_time: datetime
@@ -89,3 +96,9 @@ class SchedulerService:
         """
         result = self._scheduler_repo.update_last_run_time(job_id, run_time)
         return result is not None
+
+
+@lru_cache(maxsize=1)
+def _scheduler_service() -> SchedulerService:
+    """创建SchedulerService单例."""
+    return SchedulerService(SchedulerRepository.get_instance())
@@ -1,12 +1,14 @@
-"""API速率限制器（内存版，支持反向代理）."""
+"""API速率限制器（Redis版，支持反向代理）."""
 import functools
 import logging
+import secrets
+import threading
 import time
-from collections import defaultdict
 
 from flask import jsonify, request
 
 from config import Config
+from core.huey import huey
 from services import services
 
 logger = logging.getLogger(__name__)
@@ -25,27 +27,33 @@ def get_real_client_ip() -> str:
     Returns:
         客户端IP地址
     """
+    # 直接读WSGI environ，跳过Headers包装的逐项不区分大小写查找
+    environ = request.environ
+
     # X-Forwarded-For格式: client, proxy1, proxy2
     # 取第一个IP（客户端真实IP）
-    forwarded = request.headers.get('X-Forwarded-For')
+    forwarded: str | None = environ.get('HTTP_X_FORWARDED_FOR')
     if forwarded:
-        return forwarded.split(',')[0].strip()
+        return forwarded.split(',', 1)[0].strip()
 
     # X-Real-IP
-    real_ip = request.headers.get('X-Real-IP')
+    real_ip: str | None = environ.get('HTTP_X_REAL_IP')
     if real_ip:
         return real_ip.strip()
 
     # Cloudflare
-    cf_ip = request.headers.get('CF-Connecting-IP')
+    cf_ip: str | None = environ.get('HTTP_CF_CONNECTING_IP')
     if cf_ip:
         return cf_ip.strip()
 
     # 直连情况
-    return request.remote_addr or 'unknown'
+    remote_addr: str | None = environ.get('REMOTE_ADDR')
+    return remote_addr or 'unknown'
 
 
-def get_identifier(api_endpoint: str | None = None) -> str:
+def get_identifier(
+    api_endpoint: str | None = None
+) -> tuple[str, str, str]:
     """
     获取标识符（优先使用API密钥，否则使用真实IP）.
 
@@ -53,25 +61,41 @@ def get_identifier(api_endpoint: str | None = None) -> str:
         api_endpoint: API端点名称
 
     Returns:
-        标识符字符串
+        标识符元组 (API端点, 类型, 值)，写入Redis时才拼接为键
     """
     # 从Header获取API密钥
     api_key = request.headers.get('X-API-Key')
 
     if api_key:
-        if api_endpoint:
-            return f"{api_endpoint}:apikey:{api_key}"
-        return f"apikey:{api_key}"
+        return api_endpoint or '', 'apikey', api_key
 
     # 使用真实IP
-    ip = get_real_client_ip()
-    if api_endpoint:
-        return f"{api_endpoint}:ip:{ip}"
-    return f"ip:{ip}"
+    return api_endpoint or '', 'ip', get_real_client_ip()
 
 
 class ApiRateLimiter:
-    """基于内存的滑动窗口速率限制器."""
+    """基于Redis有序集合的滑动窗口速率限制器（多进程共享计数）."""
+
+    # 淘汰窗口外记录、计数、写入在一个脚本内原子完成
+    _SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+local count = redis.call('ZCARD', key)
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, window)
+    return {1, limit - count - 1, now + window}
+end
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+local reset = now + window
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window
+end
+return {0, 0, reset}
+"""
 
     def __init__(self):
         """
@@ -82,40 +106,11 @@ class ApiRateLimiter:
         self.rate_limit_with_key = Config.RATE_LIMIT_WITH_KEY
         self.window_seconds = Config.RATE_LIMIT_WINDOW_SECONDS
 
-        # 存储每个标识符的请求时间戳
-        # 格式: {identifier: [timestamp1, timestamp2, ...]}
-        self._request_records: defaultdict[str, list[float]] = (
-            defaultdict(list)
-        )
-
-        # 最后清理时间
-        self._last_cleanup_time: float = time.time()
-
-    def _cleanup_expired_records(self) -> None:
-        """清理过期的请求记录."""
-        current_time = time.time()
-        # 每60秒清理一次
-        if current_time - self._last_cleanup_time < 60:
-            return
-
-        window_start = current_time - self.window_seconds
-
-        for identifier in list(self._request_records.keys()):
-            # 过滤掉过期的时间戳
-            self._request_records[identifier] = [
-                ts
-                for ts in self._request_records[identifier]
-                if ts > window_start
-            ]
-
-            # 如果列表为空，删除该键
-            if not self._request_records[identifier]:
-                del self._request_records[identifier]
-
-        self._last_cleanup_time = current_time
-        logger.debug(
-            f"Cleaned up expired rate limit records, "
-            f"active identifiers: {len(self._request_records)}"
+        # 复用Huey的Redis连接，记录随PEXPIRE自动过期
+        self._redis = huey.storage.conn
+        self._key_prefix = f'pixcollector-{Config.ENV}:ratelimit'
+        self._script = self._redis.register_script(
+            self._SLIDING_WINDOW_SCRIPT
         )
 
     def get_rate_limit(self, has_valid_key: bool) -> int:
@@ -135,7 +130,7 @@ class ApiRateLimiter:
         )
 
     def is_allowed(
-        self, identifier: str, limit: int
+        self, identifier: tuple[str, str, str], limit: int
     ) -> tuple[bool, int, int]:
         """
         检查是否允许请求.
@@ -147,42 +142,28 @@ class ApiRateLimiter:
         Returns:
             (是否允许, 剩余次数, 重置时间)
         """
-        # 清理过期记录
-        self._cleanup_expired_records()
-
-        current_time = time.time()
-        window_start = current_time - self.window_seconds
-
-        # 获取该标识符的请求记录
-        records = self._request_records[identifier]
-
-        # 过滤掉窗口外的记录
-        records[:] = [
-            ts for ts in records
-            if ts > window_start
-        ]
-
-        # 检查是否超过限制
-        count = len(records)
-        if count < limit:
-            # 允许请求，记录时间戳
-            records.append(current_time)
-            remaining = limit - count - 1
-            reset_time = int(current_time + self.window_seconds)
-            return True, remaining, reset_time
-        else:
-            # 超过限制
-            remaining = 0
-            # 获取最早请求的重置时间
-            if records:
-                reset_time = int(records[0] + self.window_seconds)
-            else:
-                reset_time = int(current_time + self.window_seconds)
-            return False, remaining, reset_time
+        now_ms = int(time.time() * 1000)
+        window_ms = self.window_seconds * 1000
+
+        try:
+            allowed, remaining, reset_ms = self._script(
+                keys=[':'.join((self._key_prefix, *identifier))],
+                args=[
+                    now_ms, window_ms, limit,
+                    f'{now_ms}-{secrets.token_hex(4)}'
+                ]
+            )
+        except Exception as e:
+            # Redis不可用时放行，避免限流器拖垮公开API
+            logger.error(f"Rate limit check failed: {e}")
+            return True, limit, int((now_ms + window_ms) / 1000)
+
+        return bool(allowed), int(remaining), int(reset_ms) // 1000
 
 
 # 全局速率限制器实例
 _rate_limiter: ApiRateLimiter | None = None
+_rate_limiter_lock = threading.Lock()
 
 
 def get_rate_limiter() -> ApiRateLimiter:
@@ -194,14 +175,18 @@ def get_rate_limiter() -> ApiRateLimiter:
     """
     global _rate_limiter
     if _rate_limiter is None:
-        _rate_limiter = ApiRateLimiter()
+        # 多线程worker下首批请求并发到达时只创建一个实例
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = ApiRateLimiter()
     return _rate_limiter
 
 
 def reset_rate_limiter() -> None:
     """重置速率限制器."""
     global _rate_limiter
-    _rate_limiter = None
+    with _rate_limiter_lock:
+        _rate_limiter = None
 
 
 def rate_limit():
@@ -228,11 +213,11 @@ def rate_limit():
 
             if api_key_str:
                 try:
-                    api_key = services.api_key.get_by_key(api_key_str)
-                    if api_key and api_key.is_active:
+                    # 有效性走进程内缓存，使用统计累积后批量写回
+                    if services.api_key.is_active_key(api_key_str):
                         has_valid_key = True
                         # 更新使用统计
-                        services.api_key.update_usage(api_key_str)
+                        services.api_key.record_usage(api_key_str)
                 except Exception as e:
                     logger.error(f"Failed to validate API key: {e}")
 
@@ -66,22 +66,22 @@ class Pagination:
         Yields:
             页码或None（表示省略号）
         """
+        # 左边缘、当前页附近、右边缘三段连续区间，直接按区间取并集
+        left = range(1, min(left_edge, self.pages) + 1)
+        center = range(
+            max(1, self.page - left_current),
+            min(self.pages, self.page + right_current - 1) + 1
+        )
+        right = range(
+            max(1, self.pages - right_edge + 1), self.pages + 1
+        )
+
         last = 0
-        for num in range(1, self.pages + 1):
-            is_center = (
-                self.page - left_current - 1 <
-                num <
-                self.page + right_current
-            )
-            if (
-                num <= left_edge or
-                is_center or
-                num > self.pages - right_edge
-            ):
-                if last + 1 != num:
-                    yield None
-                yield num
-                last = num
+        for num in sorted(set(left) | set(center) | set(right)):
+            if last + 1 != num:
+                yield None
+            yield num
+            last = num
         if last != self.pages:
             yield None
 
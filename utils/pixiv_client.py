@@ -1,13 +1,104 @@
 """Pixiv API客户端（纯粹的API调用，不涉及数据库）."""
 import logging
+import random
+import time
+from collections.abc import Callable
 from datetime import datetime, timedelta
-from typing import Any, Literal, cast
+from functools import wraps
+from typing import Any, Literal
 
-from pixivpy3 import ByPassSniApi
-from pixivpy3.aapi import _MODE, _TYPE
+from pixivpy3 import ByPassSniApi, PixivError
+from requests import RequestException
 
 logger = logging.getLogger(__name__)
 
+# 网络错误或被限流时的最大重试次数
+MAX_RETRIES = 8
+# 指数退避的基础延迟与上限（秒）
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 120.0
+# 支持的排行榜模式
+_VALID_MODES = frozenset({'day', 'week', 'month', ''})
+
+
+def _is_rate_limited(result: Any) -> bool:
+    """
+    判断API返回是否为限流错误（pixivpy以error字段返回而非抛出异常）.
+
+    Args:
+        result: API返回数据
+
+    Returns:
+        是否被限流
+    """
+    error = getattr(result, 'error', None)
+    message = getattr(error, 'message', None) if error else None
+    return bool(message) and 'Rate Limit' in str(message)
+
+
+def _retry_on_error(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    API调用重试装饰器.
+
+    网络错误或限流时按指数退避加随机抖动重试，最多MAX_RETRIES次，
+    其他错误直接抛出.
+
+    Args:
+        fn: 被装饰的API方法
+
+    Returns:
+        包装后的方法
+    """
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        attempt = 0
+        while True:
+            try:
+                result = fn(*args, **kwargs)
+            except (PixivError, RequestException) as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                reason = str(e)
+            else:
+                if attempt == MAX_RETRIES or not _is_rate_limited(result):
+                    return result
+                reason = 'Rate Limit'
+
+            delay = min(
+                RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt
+            ) + random.uniform(0, RETRY_BASE_DELAY)
+            logger.warning(
+                f"{fn.__name__} failed ({reason}), "
+                f"retry {attempt + 1}/{MAX_RETRIES} in {delay:.1f}s"
+            )
+            time.sleep(delay)
+            attempt += 1
+
+    return wrapper
+
+
+def _log_errors(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    API调用错误日志装饰器.
+
+    记录异常后原样抛出，方法体内无需各自包一层try/except.
+
+    Args:
+        fn: 被装饰的API方法
+
+    Returns:
+        包装后的方法
+    """
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Failed to {fn.__name__}: {e}")
+            raise
+
+    return wrapper
+
 
 class PixivClient:
     """Pixiv API客户端封装."""
@@ -33,6 +124,8 @@ class PixivClient:
         self.user_id = user_id
         self.token_expiry: datetime | None = None  # token过期时间
 
+    @_retry_on_error
+    @_log_errors
     def get_ranking(
         self,
         mode: str,
@@ -51,15 +144,14 @@ class PixivClient:
         Raises:
             Exception: 获取失败
         """
-        try:
-            if mode not in ['day', 'week', 'month', '']:
-                raise
-            literal_mode = cast(_MODE, mode)
-            return self._api.illust_ranking(mode=literal_mode, offset=offset)
-        except Exception as e:
-            logger.error(f"Failed to get ranking: {e}")
-            raise
-
+        if mode not in _VALID_MODES:
+            raise ValueError(f"Invalid ranking mode: {mode}")
+        return self._api.illust_ranking(
+            mode=mode, offset=offset  # type: ignore[arg-type]
+        )
+
+    @_retry_on_error
+    @_log_errors
     def get_following(
         self,
         offset: int = 0
@@ -77,15 +169,12 @@ class PixivClient:
         Raises:
             Exception: 获取失败
         """
-        try:
-            if not self.user_id:
-                raise
-
-            return self._api.user_following(int(self.user_id), offset=offset)
-        except Exception as e:
-            logger.error(f"Failed to get following: {e}")
-            raise
+        if not self.user_id:
+            raise ValueError('Not login')
+        return self._api.user_following(int(self.user_id), offset=offset)
 
+    @_retry_on_error
+    @_log_errors
     def get_user_illusts(
         self,
         user_id: int,
@@ -106,17 +195,14 @@ class PixivClient:
         Raises:
             Exception: 获取失败
         """
-        try:
-            literal_type = cast(_TYPE, illust_type)
-            return self._api.user_illusts(
-                user_id,
-                offset=offset,
-                type=literal_type
-            )
-        except Exception as e:
-            logger.error(f"Failed to get user illusts: {e}")
-            raise
-
+        return self._api.user_illusts(
+            user_id,
+            offset=offset,
+            type=illust_type  # type: ignore[arg-type]
+        )
+
+    @_retry_on_error
+    @_log_errors
     def get_follow_illusts(
         self,
         offset: int | str = 0,
@@ -135,15 +221,13 @@ class PixivClient:
         Raises:
             Exception: 获取失败
         """
-        try:
-            return self._api.illust_follow(
-                restrict=restrict,
-                offset=offset
-            )
-        except Exception as e:
-            logger.error(f"Failed to get follow illusts: {e}")
-            raise
+        return self._api.illust_follow(
+            restrict=restrict,
+            offset=offset
+        )
 
+    @_retry_on_error
+    @_log_errors
     def get_illust_detail(self, illust_id: int) -> Any:
         """
         获取作品详情.
@@ -157,12 +241,9 @@ class PixivClient:
         Raises:
             Exception: 获取失败
         """
-        try:
-            return self._api.illust_detail(illust_id)
-        except Exception as e:
-            logger.error(f"Failed to get illust detail: {e}")
-            raise
+        return self._api.illust_detail(illust_id)
 
+    @_log_errors
     def refresh_tokens(self) -> None:
         """
         刷新访问令牌.
@@ -173,22 +254,19 @@ class PixivClient:
         Raises:
             Exception: 刷新失败
         """
-        try:
-            # 使用refresh_token刷新
-            self._api.auth(refresh_token=self.refresh_token)
-            # 更新本地存储
-            self.access_token = self._api.access_token or ''
-            self.refresh_token = self._api.refresh_token or ''
-            self.user_id = int(self._api.user_id) or 0
-            # 设置过期时间为1小时后
-            self.token_expiry = datetime.now() + timedelta(hours=1)
-
-            logger.info("Tokens refreshed successfully")
-            return
-        except Exception as e:
-            logger.error(f"Failed to refresh tokens: {e}")
-            raise
-
+        # 使用refresh_token刷新
+        self._api.auth(refresh_token=self.refresh_token)
+        # 更新本地存储
+        self.access_token = self._api.access_token or ''
+        self.refresh_token = self._api.refresh_token or ''
+        self.user_id = int(self._api.user_id) or 0
+        # 设置过期时间为1小时后
+        self.token_expiry = datetime.now() + timedelta(hours=1)
+
+        logger.info("Tokens refreshed successfully")
+        return
+
+    @_log_errors
     def parse_qs(self, url: str) -> dict[str, Any] | None:
         """
         解析URL查询字符串.
@@ -199,12 +277,8 @@ class PixivClient:
         Returns:
             查询参数字典
         """
-        try:
-            result: dict[str, Any] | None = self._api.parse_qs(url)
-            return result
-        except Exception as e:
-            logger.error(f"Failed to parse query string: {e}")
-            raise
+        result: dict[str, Any] | None = self._api.parse_qs(url)
+        return result
 
     def verify_token(self) -> None:
         """
@@ -225,6 +299,8 @@ class PixivClient:
             logger.warning(f"Token verification failed: {e}")
             raise
 
+    @_retry_on_error
+    @_log_errors
     def search_illust(
         self,
         word: str,
@@ -260,14 +336,10 @@ class PixivClient:
         Raises:
             Exception: 搜索失败
         """
-        try:
-            return self._api.search_illust(
-                word=word,
-                search_target='partial_match_for_tags',
-                sort='date_desc',
-                offset=offset,
-                search_ai_type=0,
-            )
-        except Exception as e:
-            logger.error(f"Failed to search illust: {e}")
-            raise
+        return self._api.search_illust(
+            word=word,
+            search_target='partial_match_for_tags',
+            sort='date_desc',
+            offset=offset,
+            search_ai_type=0,
+        )
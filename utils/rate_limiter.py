@@ -1,8 +1,8 @@
 """速率限制器."""
 import logging
 import random
+import threading
 import time
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +19,8 @@ class RateLimiter:
         error_delay_403_min: float = 30.0,
         error_delay_403_max: float = 50.0,
         error_delay_other_min: float = 10.0,
-        error_delay_other_max: float = 30.0
+        error_delay_other_max: float = 30.0,
+        burst: int = 1
     ):
         """
         初始化速率限制器.
@@ -33,6 +34,7 @@ class RateLimiter:
             error_delay_403_max: 403错误最大延迟（秒）
             error_delay_other_min: 其他错误最小延迟（秒）
             error_delay_other_max: 其他错误最大延迟（秒）
+            burst: 令牌桶容量（允许连续发送的请求数，默认1即不突发）
         """
         self.delay_min = delay_min
         self.delay_max = delay_max
@@ -43,40 +45,53 @@ class RateLimiter:
         self.error_delay_other_min = error_delay_other_min
         self.error_delay_other_max = error_delay_other_max
 
-        self.last_request_time: datetime | None = None
-        self.last_error_time: datetime | None = None
+        # time.monotonic()时间点，不受系统时钟调整影响
+        self.last_request_time: float | None = None
+        self.last_error_time: float | None = None
         self.last_error_code: int | None = None
 
+        # 令牌桶：平均速率与正常延迟的均值一致
+        self.burst = burst
+        self.rate = 2.0 / max(delay_min + delay_max, 0.001)
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._error_until = 0.0
+        self._lock = threading.Lock()
+
     def wait(self) -> None:
-        """等待直到可以发送下一个请求."""
-        # 如果有最近的错误，根据错误代码等待
-        if self.last_error_time and self.last_error_code:
-            delay = self._get_error_delay(self.last_error_code)
-            elapsed = (datetime.now() - self.last_error_time).total_seconds()
-
-            if elapsed < delay:
-                wait_time = delay - elapsed
-                logger.info(
-                    f"Waiting {wait_time:.2f}s due to "
-                    f"previous {self.last_error_code} error"
-                )
-                time.sleep(wait_time)
-
-            self.last_error_time = None
-            self.last_error_code = None
-        else:
-            # 正常延迟
-            if self.last_request_time:
-                elapsed = (
-                    datetime.now() - self.last_request_time
-                ).total_seconds()
-                delay = random.uniform(self.delay_min, self.delay_max)
+        """
+        等待直到可以发送下一个请求.
+
+        按令牌桶限速（等同acquire()），错误延迟期间同样等待.
+        """
+        self.acquire()
+        self.last_request_time = time.monotonic()
+
+    def acquire(self, cost: float = 1.0) -> None:
+        """
+        令牌桶限速：桶内有令牌时立即返回，否则等待令牌补充.
+
+        线程安全；令牌不足时先预占（允许为负），
+        多个线程按调用顺序依次等待. 错误延迟期间同样等待.
 
-                if elapsed < delay:
-                    wait_time = delay - elapsed
-                    time.sleep(wait_time)
+        Args:
+            cost: 本次请求消耗的令牌数
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            self._tokens -= cost
+            wait_time = max(
+                -self._tokens / self.rate,
+                self._error_until - now
+            )
 
-        self.last_request_time = datetime.now()
+        if wait_time > 0:
+            time.sleep(wait_time)
 
     def fast_wait(self, delay_min: float, delay_max: float) -> None:
         delay = random.uniform(delay_min, delay_max)
@@ -91,8 +106,11 @@ class RateLimiter:
         Args:
             error_code: HTTP错误代码
         """
-        self.last_error_time = datetime.now()
+        now = time.monotonic()
+        self.last_error_time = now
         self.last_error_code = error_code
+        with self._lock:
+            self._error_until = now + self._get_error_delay(error_code)
 
     def _get_error_delay(self, error_code: int | None) -> float:
         """
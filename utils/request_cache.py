@@ -0,0 +1,46 @@
+"""请求级缓存工具."""
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from flask import g, has_app_context
+
+_CACHE_ATTR = '_svc_cache'
+
+
+def request_cached[**P, R](fn: Callable[P, R]) -> Callable[P, R]:
+    """
+    请求级缓存装饰器.
+
+    同一次HTTP请求内相同参数的调用只执行一次，结果保存在flask.g中，
+    请求结束后自动丢弃；不在应用上下文中（如Huey worker）时直接调用.
+    写操作后如需在同一请求内读取新值，调用clear_request_cache().
+
+    Args:
+        fn: 被装饰的函数（参数需可哈希）
+
+    Returns:
+        包装后的函数
+    """
+    @wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if not has_app_context():
+            return fn(*args, **kwargs)
+
+        cache: dict[Any, Any] = g.setdefault(_CACHE_ATTR, {})
+        key = (fn, args, tuple(sorted(kwargs.items())))
+        if key in cache:
+            result: R = cache[key]
+            return result
+
+        result = fn(*args, **kwargs)
+        cache[key] = result
+        return result
+
+    return wrapper
+
+
+def clear_request_cache() -> None:
+    """清除当前请求的缓存."""
+    if has_app_context():
+        g.pop(_CACHE_ATTR, None)
@@ -1,6 +1,8 @@
 """Huey任务运行状态跟踪装饰器."""
 import logging
 import os
+import threading
+import time
 from datetime import datetime
 from functools import wraps
 
@@ -9,6 +11,15 @@ from core.huey import huey
 
 WORKER_ID = os.getpid()
 
+# 任务运行超过该秒数才写入redis，短任务只在本进程内登记
+FLUSH_DELAY = 5.0
+
+# 本进程内正在运行的任务: {key: 开始时间戳}
+_local_running: dict[str, str] = {}
+# 已写入redis、结束时需要删除的key
+_flushed: set[str] = set()
+_local_lock = threading.Lock()
+
 logger = logging.getLogger('huey.tracker')
 
 
@@ -16,7 +27,8 @@ def track_task(fn):
     """
     任务状态跟踪装饰器.
 
-    在任务执行前记录到redis，执行完成后删除。
+    任务开始时在本进程内登记，运行超过FLUSH_DELAY秒才写入redis，
+    执行完成后一并删除。
 
     Args:
         fn: 被装饰的函数
@@ -24,17 +36,24 @@ def track_task(fn):
     Returns:
         包装后的函数
     """
+    # 函数名与进程号在worker生命周期内不变，key只需拼接一次
+    key = f"huey-{Config.ENV}:task:track:running:{fn.__name__}:{WORKER_ID}"
+
     @wraps(fn)
     def wrapper(*args, **kwargs):
-        key = f"huey-{Config.ENV}:task:track:running:{fn.__name__}:{WORKER_ID}"
         # 记录任务开始信息
-        _put_data(key, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        with _local_lock:
+            _local_running[key] = repr(time.time())
+        timer = threading.Timer(FLUSH_DELAY, _flush_to_redis, args=(key,))
+        timer.daemon = True
+        timer.start()
 
         try:
             return fn(*args, **kwargs)
         finally:
             # 任务完成后清理记录
-            _delete(key)
+            timer.cancel()
+            _finish(key)
 
     return wrapper
 
@@ -53,28 +72,33 @@ def dump_running_tasks():
     if _shutdown_called:
         return
     _shutdown_called = True
-    keys = search(f"huey-{Config.ENV}:task:track:running:*")
+    with _local_lock:
+        running: dict[str, str | None] = dict(_local_running)
+    # 一次SCAN取key、一次MGET取值，本地登记优先
+    redis_keys = search(f"huey-{Config.ENV}:task:track:running:*")
+    for k, data in zip(redis_keys, _get_many(redis_keys), strict=True):
+        if not running.get(k):
+            running[k] = data
     logger.info("Check running tasks...")
     count = 0
-    for k in keys:
-        data = _get_data(k)
+    for k in sorted(running):
+        data = running[k]
         if data:
-            start_time = (
-                datetime.strptime(data, '%Y-%m-%d %H:%M:%S')
-                if data else None
+            # 只在shutdown时把时间戳格式化为可读时间
+            start_ts = float(data)
+            start_time = datetime.fromtimestamp(start_ts).replace(
+                microsecond=0
             )
-            duration = datetime.now() - start_time if start_time else None
             logger.info(f" + {k}")
             logger.info(f" + Start at {start_time}")
             logger.info(
-                f" + Running for: "
-                f"{(duration.total_seconds() if duration else 0):.2f}s"
+                f" + Running for: {time.time() - start_ts:.2f}s"
             )
             count += 1
         else:
             logger.info(f" + {k} (no data)")
             count += 1
-        _delete(k)
+    _delete(*redis_keys)
 
     if count == 0:
         logger.info("No running tasks")
@@ -82,32 +106,48 @@ def dump_running_tasks():
         logger.info("Waiting for tasks finished...")
 
 
+def _flush_to_redis(key: str):
+    """任务运行超过FLUSH_DELAY秒仍未结束时写入redis."""
+    with _local_lock:
+        data = _local_running.get(key)
+        if data is None:
+            return
+        _put_data(key, data)
+        _flushed.add(key)
+
+
+def _finish(key: str):
+    """任务结束：移除本地登记，已写入redis的同时删除."""
+    with _local_lock:
+        _local_running.pop(key, None)
+        if key in _flushed:
+            _flushed.discard(key)
+            _delete(key)
+
+
 def _put_data(key: str, data: str):
     redis = huey.storage.conn
-    redis.setex(
-        key.encode(),
-        3600,
-        data.encode()
-    )
+    redis.setex(key, 3600, data)
 
 
-def _get_data(key: str) -> str | None:
-    k = key.encode()
+def _get_many(keys: list[str]) -> list[str | None]:
+    if not keys:
+        return []
     redis = huey.storage.conn
-    pipe = redis.pipeline()
-    pipe.exists(k)
-    pipe.get(k)
-    exists, val = pipe.execute()
-    data = None if not exists else val.decode()
-    return data
+    return [
+        None if val is None else val.decode()
+        for val in redis.mget(keys)
+    ]
 
 
-def _delete(key: str):
+def _delete(*keys: str):
+    if not keys:
+        return
     redis = huey.storage.conn
-    redis.delete(key.encode())
+    redis.delete(*keys)
 
 
 def search(key_partten: str) -> list[str]:
     redis = huey.storage.conn
-    keys = redis.scan_iter(key_partten)
+    keys = redis.scan_iter(match=key_partten, count=500)
     return [x.decode('utf-8') for x in keys]
@@ -1,15 +1,30 @@
 """时间处理工具模块."""
-from datetime import UTC, datetime
+import time
+from datetime import UTC, datetime, timedelta, timezone
+
+# 本地时区全年无夏令时则偏移固定，模块加载时确定一次；
+# 有夏令时的时区为None，仍由astimezone()按日期查询
+_LOCAL_TZ: timezone | None = (
+    None if time.daylight
+    else timezone(timedelta(seconds=-time.timezone))
+)
+_LOCAL_IS_UTC = _LOCAL_TZ is not None and time.timezone == 0
+
+# 不带时区的UTC纪元，用于直接构造naive UTC时间
+_EPOCH = datetime(1970, 1, 1)
 
 
 def get_utc_now() -> datetime:
     """
     获取当前UTC时间.
 
+    纪元加时间差直接得到naive时间，省去先构造带时区对象再剥离；
+    需要与带时区时间比较时由调用方自行转换.
+
     Returns:
         datetime: 当前UTC时间（不带时区信息）
     """
-    return datetime.now(UTC).replace(tzinfo=None)
+    return _EPOCH + timedelta(seconds=time.time())
 
 
 def to_local_time(utc_datetime: datetime | None) -> datetime | None:
@@ -27,10 +42,13 @@ def to_local_time(utc_datetime: datetime | None) -> datetime | None:
 
     # 如果时间对象没有时区信息，假设它是UTC时间
     if utc_datetime.tzinfo is None:
+        # 本地时区即UTC时无需转换
+        if _LOCAL_IS_UTC:
+            return utc_datetime
         utc_datetime = utc_datetime.replace(tzinfo=UTC)
 
     # 转换为本地时间并移除时区信息
-    local_datetime = utc_datetime.astimezone()
+    local_datetime = utc_datetime.astimezone(_LOCAL_TZ)
     return local_datetime.replace(tzinfo=None)
 
 